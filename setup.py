@@ -1,9 +1,18 @@
 from setuptools import setup, find_packages
 
+# Build the optional Cython volatility kernel when Cython is available
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize("src/fastmath/volatility.pyx", language_level=3)
+except ImportError:
+    ext_modules = []
+
 setup(
     name="crypto_trading_bot",
     version="0.1.0",
     packages=find_packages(),
+    ext_modules=ext_modules,
+    package_data={'src.ui': ['static/*.html']},
     install_requires=[
         "aiohttp>=3.7.0",
         "pandas>=1.3.0",
@@ -15,5 +24,17 @@ setup(
         "pytest>=7.0.0",
         "pytest-asyncio>=0.18.0",
     ],
+    extras_require={
+        "fast": [
+            "numba>=0.57.0",
+            "orjson>=3.8.0",
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+            "xxhash>=3.0.0",
+            "msgspec>=0.18.0",
+        ],
+        "aot": [
+            "cython>=3.0.0",
+        ],
+    },
     python_requires=">=3.8",
 )
\ No newline at end of file
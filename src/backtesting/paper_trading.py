@@ -6,10 +6,13 @@ This module simulates trading without using real funds.
 import asyncio
 import json
 import logging
+import queue
 import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set, Tuple, Union
 
+import numpy as np
+
 from ..models.base_models import (
     Order, OrderSide, OrderStatus, OrderType, Position, PositionSide, Signal, Trade,
     Exchange, ExchangeType
@@ -342,7 +345,8 @@ class PaperTradingExchange(ExchangeInterface):
                     side=PositionSide.LONG,
                     entry_price=order.price,
                     quantity=order.quantity,
-                    strategy_id=order.strategy_id
+                    strategy_id=order.strategy_id,
+                    id=f"{order.exchange}:{order.trading_pair}"
                 )
             else:
                 position = self.positions[position_key]
@@ -376,7 +380,8 @@ class PaperTradingExchange(ExchangeInterface):
                     side=PositionSide.SHORT,
                     entry_price=order.price,
                     quantity=order.quantity,
-                    strategy_id=order.strategy_id
+                    strategy_id=order.strategy_id,
+                    id=f"{order.exchange}:{order.trading_pair}"
                 )
             else:
                 position = self.positions[position_key]
@@ -624,50 +629,71 @@ class PaperTradingSystem:
     
     async def update_positions(self) -> None:
         """Update all positions with current market prices."""
-        for exchange_name, exchange in self.exchanges.items():
-            for position_key, position in exchange.positions.items():
-                # Get current price
-                ticker = await self.data_collector.fetch_ticker(exchange_name, position.trading_pair)
-                if ticker:
-                    # Monitor position
-                    self.monitoring_system.monitor_position(position, ticker.close_price)
-                    
-                    # Update position risk
-                    position_id = f"{exchange_name}:{position.trading_pair}"
-                    current_stop = position.stop_loss_price
-                    
-                    new_stop = self.risk_manager.update_position_risk(
-                        position_id, ticker.close_price, current_stop
+        positions = [
+            (exchange_name, position)
+            for exchange_name, exchange in self.exchanges.items()
+            for position in exchange.positions.values()
+        ]
+        
+        # Fetch current prices for all positions concurrently
+        tickers = await asyncio.gather(
+            *(self.data_collector.fetch_ticker(exchange_name, position.trading_pair)
+              for exchange_name, position in positions),
+            return_exceptions=True
+        )
+        
+        priced = []
+        for (exchange_name, position), ticker in zip(positions, tickers):
+            if isinstance(ticker, Exception):
+                logger.error(f"Error fetching ticker for {position.trading_pair} on {exchange_name}: {ticker}")
+                continue
+            if ticker:
+                priced.append((exchange_name, position, ticker.close_price))
+        
+        # Monitor all priced positions in one batch
+        self.monitoring_system.monitor_positions(
+            [position for _, position, _ in priced],
+            np.array([price for _, _, price in priced], dtype=np.float64)
+        )
+        
+        # Update position risk and trailing stops for all priced positions in one call
+        new_stops = self.risk_manager.refresh_trailing_stops(
+            {position.id: price for _, position, price in priced},
+            {position.id: position.stop_loss for _, position, _ in priced
+             if position.stop_loss is not None}
+        )
+        
+        for exchange_name, position, price in priced:
+            position_id = position.id
+            new_stop = new_stops.get(position_id)
+            if new_stop is not None:
+                position.stop_loss = new_stop
+                logger.info(f"Updated stop-loss for {position_id}: {new_stop}")
+            
+            # Check if stop-loss is triggered
+            if position.stop_loss:
+                if (position.side == PositionSide.LONG and price <= position.stop_loss) or \
+                   (position.side == PositionSide.SHORT and price >= position.stop_loss):
+                    # Create exit signal
+                    signal = Signal(
+                        id=str(uuid.uuid4()),
+                        strategy_id=position.strategy_id,
+                        trading_pair=position.trading_pair,
+                        exchange=exchange_name,
+                        signal_type="EXIT",
+                        direction=position.side,
+                        strength=1.0,
+                        price=price,
+                        quantity=position.quantity,
+                        timestamp=datetime.now(),
+                        expiration=datetime.now() + timedelta(minutes=5),
+                        metadata={"reason": "stop_loss"}
                     )
                     
-                    if new_stop and new_stop != current_stop:
-                        position.stop_loss_price = new_stop
-                        logger.info(f"Updated stop-loss for {position_id}: {new_stop}")
+                    # Execute signal
+                    await self.execute_signal(signal)
                     
-                    # Check if stop-loss is triggered
-                    if position.stop_loss_price:
-                        if (position.side == PositionSide.LONG and ticker.close_price <= position.stop_loss_price) or \
-                           (position.side == PositionSide.SHORT and ticker.close_price >= position.stop_loss_price):
-                            # Create exit signal
-                            signal = Signal(
-                                id=str(uuid.uuid4()),
-                                strategy_id=position.strategy_id,
-                                trading_pair=position.trading_pair,
-                                exchange=exchange_name,
-                                signal_type="EXIT",
-                                direction=position.side,
-                                strength=1.0,
-                                price=ticker.close_price,
-                                quantity=position.quantity,
-                                timestamp=datetime.now(),
-                                expiration=datetime.now() + timedelta(minutes=5),
-                                metadata={"reason": "stop_loss"}
-                            )
-                            
-                            # Execute signal
-                            await self.execute_signal(signal)
-                            
-                            logger.warning(f"Stop-loss triggered for {position_id} at {ticker.close_price}")
+                    logger.warning(f"Stop-loss triggered for {position_id} at {price}")
     
     def _calculate_total_balance(self) -> float:
         """
@@ -694,8 +720,11 @@ class PaperTradingSystem:
         while True:
             try:
                 # Process signals
-                while not signals_queue.empty():
-                    signal = signals_queue.get_nowait()
+                while True:
+                    try:
+                        signal = signals_queue.get_nowait()
+                    except queue.Empty:
+                        break
                     await self.execute_signal(signal)
                 
                 # Update orders and positions
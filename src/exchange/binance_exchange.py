@@ -2,11 +2,14 @@
 Binance exchange implementation.
 """
 
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 from datetime import datetime
 
+import aiohttp
+
 from .exchange_interface import ExchangeInterface
 from ..models.base_models import Order, OrderSide, OrderStatus, OrderType, MarketData, Trade
+from ..utils import fastjson
 
 class BinanceExchange(ExchangeInterface):
     """
@@ -35,6 +38,50 @@ class BinanceExchange(ExchangeInterface):
         # Implementation for Binance
         pass
     
+    async def stream_tickers(self, trading_pairs: List[str]) -> AsyncIterator[MarketData]:
+        """
+        Stream ticker updates over a combined WebSocket stream.
+        
+        Args:
+            trading_pairs: Trading pairs to subscribe to (e.g., ["BTC/USDT"])
+            
+        Yields:
+            MarketData object for every ticker update received
+        """
+        symbols = {trading_pair.replace('/', '').lower(): trading_pair for trading_pair in trading_pairs}
+        streams = '/'.join(f"{symbol}@ticker" for symbol in symbols)
+        url = f"{self.exchange.websocket_url}/stream?streams={streams}"
+        
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(url, heartbeat=30) as ws:
+                async for msg in ws:
+                    if msg.type == aiohttp.WSMsgType.ERROR:
+                        break
+                    if msg.type != aiohttp.WSMsgType.TEXT:
+                        continue
+                    
+                    # Combined stream frames look like {"stream": "btcusdt@ticker", "data": {...}}
+                    data = fastjson.loads(msg.data).get('data', {})
+                    trading_pair = symbols.get(data.get('s', '').lower())
+                    if trading_pair is None:
+                        continue
+                    
+                    yield MarketData(
+                        exchange=self.exchange.name,
+                        trading_pair=trading_pair,
+                        timestamp=datetime.fromtimestamp(int(data.get('E', 0)) / 1000),
+                        open_price=float(data.get('o', 0)),
+                        high_price=float(data.get('h', 0)),
+                        low_price=float(data.get('l', 0)),
+                        close_price=float(data.get('c', 0)),
+                        volume=float(data.get('v', 0)),
+                        num_trades=int(data.get('n', 0)),
+                        bid_price=float(data.get('b', 0)),
+                        ask_price=float(data.get('a', 0)),
+                        bid_volume=float(data.get('B', 0)),
+                        ask_volume=float(data.get('A', 0))
+                    )
+    
     async def fetch_order_book(self, trading_pair: str, limit: int = 20) -> Optional[Dict]:
         """Fetch order book."""
         # Implementation for Binance
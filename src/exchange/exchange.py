@@ -46,4 +46,5 @@ class Exchange:
         self.websocket_url = websocket_url
         self.api_key = api_key
         self.api_secret = api_secret
-        self.trading_pairs = trading_pairs or [] 
\ No newline at end of file
+        self.trading_pairs = trading_pairs or []
+        self.trading_pairs_set = frozenset(self.trading_pairs)  # For O(1) membership tests 
\ No newline at end of file
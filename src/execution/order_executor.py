@@ -271,7 +271,8 @@ class OrderExecutor:
                     side=PositionSide.LONG,
                     entry_price=order.average_fill_price if order.average_fill_price else order.price,
                     quantity=order.filled_quantity,
-                    strategy_id=order.strategy_id
+                    strategy_id=order.strategy_id,
+                    id=position_key
                 )
                 self.positions[position_key] = position
                 logger.info(f"New long position: {position_key} at {position.entry_price}")
@@ -283,7 +284,8 @@ class OrderExecutor:
                     side=PositionSide.SHORT,
                     entry_price=order.average_fill_price if order.average_fill_price else order.price,
                     quantity=order.filled_quantity,
-                    strategy_id=order.strategy_id
+                    strategy_id=order.strategy_id,
+                    id=position_key
                 )
                 self.positions[position_key] = position
                 logger.info(f"New short position: {position_key} at {position.entry_price}")
@@ -0,0 +1 @@
+"""Ahead-of-time compiled numeric kernels for the cryptocurrency trading bot."""
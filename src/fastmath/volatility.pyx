@@ -0,0 +1,49 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Ahead-of-time compiled volatility kernel.
+Cython build of src.strategy._kernels._volatility, using the same Welford update and
+sample stdev; built by setup.py when Cython is installed and picked up by _kernels.
+"""
+
+from libc.math cimport sqrt
+
+
+cdef inline void _welford_update(Py_ssize_t* count, double* mean, double* m2, double x) noexcept nogil:
+    """Fold one sample into Welford running moments (mirrors _kernels._welford_update)."""
+    cdef double delta
+    count[0] += 1
+    delta = x - mean[0]
+    mean[0] += delta / count[0]
+    m2[0] += delta * (x - mean[0])
+
+
+cdef inline double _welford_std(Py_ssize_t count, double m2) noexcept nogil:
+    """Sample standard deviation from Welford moments (mirrors _kernels._welford_std)."""
+    if count < 2:
+        return 0.0
+    return sqrt(m2 / (count - 1))
+
+
+def daily_volatility(const double[::1] prices):
+    """
+    Calculate the sample standard deviation of simple returns in a single pass.
+    
+    Args:
+        prices: Contiguous float64 close prices ordered by time
+        
+    Returns:
+        Standard deviation of returns (0.0 if fewer than two returns)
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = prices.shape[0]
+    cdef Py_ssize_t count = 0
+    cdef double mean = 0.0
+    cdef double m2 = 0.0
+    cdef double result
+    
+    with nogil:
+        for i in range(1, n):
+            _welford_update(&count, &mean, &m2, prices[i] / prices[i - 1] - 1.0)
+        result = _welford_std(count, m2)
+    
+    return result
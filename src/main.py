@@ -4,38 +4,138 @@ This module coordinates all components and provides the entry point for the appl
 """
 
 import asyncio
-import json
+import atexit
+import copy
 import logging
+import logging.handlers
 import os
 import queue
 import signal
 import sys
+import time
 from datetime import datetime
 from typing import Dict, List, Optional
 
+import numpy as np
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.data.data_collector import DataCollector
 from src.exchange.binance_exchange import BinanceExchange
 from src.strategy.strategy_engine import StrategyManager
+from src.strategy._kernels import _volatility as _volatility_kernel
 from src.execution.order_executor import OrderExecutor
 from src.risk.risk_manager import RiskManager
 from src.utils.monitoring import MonitoringSystem
 from src.backtesting.paper_trading import PaperTradingSystem
 from src.exchange.exchange import Exchange, ExchangeType
+from src.utils import fastjson
+from src.utils.config import BotConfig
 
-# Configure logging
+# Configure logging - records are queued and written by a background listener thread
+# so console/file I/O never blocks the event loop
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.StreamHandler(),
+    logging.FileHandler('crypto_trading_bot.log'),
+    respect_handler_level=True
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('crypto_trading_bot.log')
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+    force=True  # Replace the handlers installed by the component modules on import
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+TRADING_CYCLE_INTERVAL = 60  # Run trading cycle every minute (seconds)
+TICKER_CACHE_TTL = 30  # Max age of a cached price used for balance conversion (seconds)
+
+# Fallback configuration used when the config file cannot be loaded
+_DEFAULT_CONFIG = {
+    'mode': 'paper',  # 'paper' or 'live'
+    'initial_capital': 10000.0,
+    'exchanges': {
+        'bybit': {
+            'api_key': '',
+            'api_secret': '',
+            'trading_pairs': ['BTC/USDT', 'ETH/USDT', 'SOL/USDT', 'BNB/USDT', 'XRP/USDT', 'ADA/USDT', 'DOGE/USDT'],
+            'initial_balances': {'USDT': 10000.0}
+        }
+    },
+    'strategies': [
+        {
+            'id': 'ma_crossover_1',
+            'name': 'Moving Average Crossover',
+            'type': 'TREND_FOLLOWING',
+            'parameters': {
+                'short_window': 50,
+                'long_window': 200,
+                'volatility_scaling': True
+            },
+            'risk_parameters': {
+                'risk_per_trade': 0.02,
+                'max_position_size': 0.2
+            },
+            'target_exchanges': ['bybit'],
+            'target_pairs': ['BTC/USDT', 'ETH/USDT'],
+            'status': 'ACTIVE'
+        },
+        {
+            'id': 'arbitrage_1',
+            'name': 'Cross-Exchange Arbitrage',
+            'type': 'ARBITRAGE',
+            'parameters': {
+                'min_profit_threshold': 0.01,
+                'max_position_size': 0.2
+            },
+            'risk_parameters': {
+                'risk_per_trade': 0.01,
+                'max_position_size': 0.1
+            },
+            'target_exchanges': ['bybit'],
+            'target_pairs': ['BTC/USDT', 'ETH/USDT'],
+            'status': 'ACTIVE'
+        }
+    ],
+    'risk_management': {
+        'max_drawdown': 0.5,  # 50% max drawdown
+        'risk_per_trade': 0.02,  # 2% risk per trade
+        'max_exposure': 0.5,  # 50% max exposure
+        'circuit_breakers': {
+            'daily_loss_limit': 0.05,  # 5% daily loss limit
+            'weekly_loss_limit': 0.15  # 15% weekly loss limit
+        }
+    },
+    'monitoring': {
+        'alerts': {
+            'email': {
+                'enabled': False,
+                'smtp_server': 'smtp.gmail.com',
+                'smtp_port': 587,
+                'username': '',
+                'password': '',
+                'from_address': '',
+                'to_address': ''
+            },
+            'telegram': {
+                'enabled': False,
+                'bot_token': '',
+                'chat_id': ''
+            }
+        }
+    }
+}
+
 
 class TradingBot:
     """
@@ -51,9 +151,25 @@ class TradingBot:
         """
         self.config_path = config_path
         self.config = self._load_config(config_path)
+        self.settings = BotConfig.from_dict(self.config)
         self.running = False
         self.signals_queue = queue.Queue()
         
+        # Trading pairs targeted by the loaded strategies, refreshed on strategy changes
+        self._all_pairs = frozenset()
+        self._pairs_by_exchange = {}
+        self._polled_pairs_by_exchange = {}
+        self._streamed_exchanges = frozenset()
+        
+        # Interned "exchange:pair" position ids
+        self._position_ids: Dict[tuple, str] = {}
+        
+        # Last seen close price per (exchange, pair): (price, monotonic timestamp)
+        self._ticker_cache: Dict[tuple, tuple] = {}
+        
+        # Scratch buffer for volatility prices, grown only when the window gets longer
+        self._price_buf = np.empty(64, dtype=np.float64)
+        
         # Initialize components
         self._init_components()
     
@@ -68,103 +184,33 @@ class TradingBot:
             Configuration dictionary
         """
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            with open(config_path, 'rb') as f:
+                config = fastjson.loads(f.read())
             
             logger.info(f"Loaded configuration from {config_path}")
             return config
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
             # Use default configuration
-            return {
-                'mode': 'paper',  # 'paper' or 'live'
-                'initial_capital': 10000.0,
-                'exchanges': {
-                    'bybit': {
-                        'api_key': '',
-                        'api_secret': '',
-                        'trading_pairs': ['BTC/USDT', 'ETH/USDT', 'SOL/USDT', 'BNB/USDT', 'XRP/USDT', 'ADA/USDT', 'DOGE/USDT'],
-                        'initial_balances': {'USDT': 10000.0}
-                    }
-                },
-                'strategies': [
-                    {
-                        'id': 'ma_crossover_1',
-                        'name': 'Moving Average Crossover',
-                        'type': 'TREND_FOLLOWING',
-                        'parameters': {
-                            'short_window': 50,
-                            'long_window': 200,
-                            'volatility_scaling': True
-                        },
-                        'risk_parameters': {
-                            'risk_per_trade': 0.02,
-                            'max_position_size': 0.2
-                        },
-                        'target_exchanges': ['bybit'],
-                        'target_pairs': ['BTC/USDT', 'ETH/USDT'],
-                        'status': 'ACTIVE'
-                    },
-                    {
-                        'id': 'arbitrage_1',
-                        'name': 'Cross-Exchange Arbitrage',
-                        'type': 'ARBITRAGE',
-                        'parameters': {
-                            'min_profit_threshold': 0.01,
-                            'max_position_size': 0.2
-                        },
-                        'risk_parameters': {
-                            'risk_per_trade': 0.01,
-                            'max_position_size': 0.1
-                        },
-                        'target_exchanges': ['bybit'],
-                        'target_pairs': ['BTC/USDT', 'ETH/USDT'],
-                        'status': 'ACTIVE'
-                    }
-                ],
-                'risk_management': {
-                    'max_drawdown': 0.5,  # 50% max drawdown
-                    'risk_per_trade': 0.02,  # 2% risk per trade
-                    'max_exposure': 0.5,  # 50% max exposure
-                    'circuit_breakers': {
-                        'daily_loss_limit': 0.05,  # 5% daily loss limit
-                        'weekly_loss_limit': 0.15  # 15% weekly loss limit
-                    }
-                },
-                'monitoring': {
-                    'alerts': {
-                        'email': {
-                            'enabled': False,
-                            'smtp_server': 'smtp.gmail.com',
-                            'smtp_port': 587,
-                            'username': '',
-                            'password': '',
-                            'from_address': '',
-                            'to_address': ''
-                        },
-                        'telegram': {
-                            'enabled': False,
-                            'bot_token': '',
-                            'chat_id': ''
-                        }
-                    }
-                }
-            }
+            return copy.deepcopy(_DEFAULT_CONFIG)
     
     def _init_components(self) -> None:
         """Initialize all trading bot components."""
+        # Trading mode is fixed for the lifetime of the bot
+        self.paper_mode = self.settings.paper_mode
+        
         # Initialize exchanges
         self.exchanges = {}
-        for exchange_name, exchange_config in self.config.get('exchanges', {}).items():
+        for exchange_name, exchange_config in self.settings.exchanges.items():
             # Create Exchange object from config
             exchange = Exchange(
                 name=exchange_name,
                 exchange_type=ExchangeType.CEX,
                 base_url="",
-                websocket_url="",
-                api_key=exchange_config.get('api_key', ''),
-                api_secret=exchange_config.get('api_secret', ''),
-                trading_pairs=exchange_config.get('trading_pairs', [])
+                websocket_url=exchange_config.websocket_url,
+                api_key=exchange_config.api_key,
+                api_secret=exchange_config.api_secret,
+                trading_pairs=list(exchange_config.trading_pairs)
             )
             
             # Create BinanceExchange with the Exchange object
@@ -174,11 +220,11 @@ class TradingBot:
         self.data_collector = DataCollector(list(self.exchanges.values()))
         
         # Initialize risk manager
-        self.risk_manager = RiskManager(self.config.get('risk_management', {}))
+        self.risk_manager = RiskManager(self.settings.risk_management)
         
         # Initialize monitoring system
         self.monitoring_system = MonitoringSystem(
-            self.config.get('monitoring', {}),
+            self.settings.monitoring,
             self.risk_manager
         )
         
@@ -189,7 +235,7 @@ class TradingBot:
         self.order_executor = OrderExecutor(self.exchanges, self.data_collector)
         
         # Initialize paper trading system if in paper mode
-        if self.config.get('mode', 'paper') == 'paper':
+        if self.paper_mode:
             self.paper_trading_system = PaperTradingSystem(
                 self.config,
                 self.data_collector,
@@ -199,31 +245,124 @@ class TradingBot:
     
     async def _load_strategies(self) -> None:
         """Load strategies from configuration."""
-        for strategy_config in self.config.get('strategies', []):
+        for strategy_config in self.settings.strategies:
             await self.strategy_manager.add_strategy(strategy_config)
             logger.info(f"Loaded strategy: {strategy_config['name']} ({strategy_config['id']})")
+        
+        self._refresh_trading_pairs()
+    
+    def _refresh_trading_pairs(self) -> None:
+        """Recompute the trading pairs to fetch after strategies are added or removed."""
+        self._all_pairs = frozenset(
+            pair
+            for strategy in self.strategy_manager.strategies.values()
+            for pair in strategy.target_pairs
+        )
+        self._pairs_by_exchange = {
+            exchange_name: self._all_pairs & exchange.exchange.trading_pairs_set
+            for exchange_name, exchange in self.exchanges.items()
+        }
+        
+        # Exchanges with a WebSocket URL and a streaming adapter are streamed; the rest are polled each cycle
+        self._streamed_exchanges = frozenset(
+            exchange_name
+            for exchange_name, exchange in self.exchanges.items()
+            if exchange.exchange.websocket_url and hasattr(exchange, 'stream_tickers')
+        )
+        self._polled_pairs_by_exchange = {
+            exchange_name: pairs
+            for exchange_name, pairs in self._pairs_by_exchange.items()
+            if exchange_name not in self._streamed_exchanges
+        }
+    
+    def _position_id(self, exchange: str, trading_pair: str) -> str:
+        """
+        Get the position id for an exchange/pair, building it only once.
+        
+        Args:
+            exchange: Exchange name
+            trading_pair: Trading pair
+            
+        Returns:
+            Position id in the form "exchange:trading_pair"
+        """
+        key = (exchange, trading_pair)
+        position_id = self._position_ids.get(key)
+        if position_id is None:
+            position_id = self._position_ids[key] = f"{exchange}:{trading_pair}"
+        return position_id
+    
+    def _cache_ticker(self, ticker) -> None:
+        """
+        Remember the latest close price of a ticker and mark open positions in its exchange/pair to it.
+        
+        Args:
+            ticker: Market data for an exchange/pair
+        """
+        self._ticker_cache[(ticker.exchange, ticker.trading_pair)] = (ticker.close_price, time.monotonic())
+        self.risk_manager.update_pair_price(ticker.exchange, ticker.trading_pair, ticker.close_price)
     
     async def _process_market_data(self) -> None:
         """Process market data through strategies."""
-        # Get trading pairs from strategies
-        trading_pairs = set()
-        for strategy in self.strategy_manager.strategies.values():
-            for pair in strategy.target_pairs:
-                trading_pairs.add(pair)
-        
-        # Fetch data for each trading pair
-        for exchange_name, exchange in self.exchanges.items():
-            for pair in trading_pairs:
-                if pair in exchange.exchange.trading_pairs:
-                    # Fetch ticker
-                    ticker = await self.data_collector.fetch_ticker(exchange_name, pair)
-                    if ticker:
-                        # Process through strategies
-                        await self.strategy_manager.process_market_data(ticker)
+        # Fetch tickers for every polled exchange/pair combination concurrently
+        keys = [
+            (exchange_name, pair)
+            for exchange_name, pairs in self._polled_pairs_by_exchange.items()
+            for pair in pairs
+        ]
+        tickers = await asyncio.gather(
+            *(self.data_collector.fetch_ticker(exchange_name, pair) for exchange_name, pair in keys),
+            return_exceptions=True
+        )
+        
+        for (exchange_name, pair), ticker in zip(keys, tickers):
+            if isinstance(ticker, Exception):
+                logger.error(f"Error fetching ticker for {pair} on {exchange_name}: {ticker}")
+                continue
+            if ticker:
+                self._cache_ticker(ticker)
+                
+                # Process through strategies
+                await self.strategy_manager.process_market_data(ticker)
     
-    async def _generate_signals(self) -> None:
-        """Generate trading signals from strategies."""
-        signals = await self.strategy_manager.generate_signals()
+    async def _ws_consumer(self, exchange_name: str) -> None:
+        """
+        Consume streamed tickers from an exchange and react to each update.
+        
+        Args:
+            exchange_name: Name of the exchange to stream from
+        """
+        exchange = self.exchanges[exchange_name]
+        trading_pairs = sorted(self._pairs_by_exchange.get(exchange_name, ()))
+        
+        while self.running:
+            try:
+                async for ticker in exchange.stream_tickers(trading_pairs):
+                    self._cache_ticker(ticker)
+                    
+                    # Process through strategies and queue signals from those trading this exchange/pair
+                    await self.strategy_manager.process_market_data(ticker)
+                    await self._generate_signals(ticker.exchange, ticker.trading_pair)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in {exchange_name} ticker stream: {e}")
+            
+            # Reconnect after a short pause
+            await asyncio.sleep(5)
+    
+    async def _generate_signals(self, exchange: Optional[str] = None, trading_pair: Optional[str] = None) -> None:
+        """
+        Generate trading signals from strategies.
+        
+        Args:
+            exchange: Exchange name; with trading_pair, only strategies routed to that exchange/pair run
+            trading_pair: Trading pair
+        """
+        if exchange is None:
+            signals = await self.strategy_manager.generate_signals()
+        else:
+            signals = await self.strategy_manager.generate_signals_for(exchange, trading_pair)
         
         for signal in signals:
             self.signals_queue.put(signal)
@@ -231,83 +370,114 @@ class TradingBot:
     
     async def _execute_signals(self) -> None:
         """Execute trading signals."""
-        if self.config.get('mode', 'paper') == 'paper':
+        if self.paper_mode:
             # Paper trading mode - signals are processed by paper trading system
             return
         
-        # Live trading mode
-        while not self.signals_queue.empty():
-            signal = self.signals_queue.get_nowait()
-            
-            # Get current volatility
-            market_data = await self.data_collector.fetch_historical_data(
-                signal.exchange, signal.trading_pair, '1d', 30
-            )
-            
-            volatility = 0.02  # Default volatility
-            if market_data and len(market_data) > 1:
-                # Calculate daily volatility using standard deviation of returns
-                prices = [data.close_price for data in market_data]
-                returns = [(prices[i] / prices[i-1]) - 1 for i in range(1, len(prices))]
-                
-                import statistics
-                volatility = statistics.stdev(returns) if returns else 0.02
+        # Live trading mode - drain the queue without a separate empty() check per signal
+        while True:
+            try:
+                signal = self.signals_queue.get_nowait()
+            except queue.Empty:
+                break
+            await self._execute_signal(signal)
+    
+    async def _execute_signal(self, signal) -> None:
+        """
+        Evaluate a single signal against risk limits and execute it.
+        
+        Args:
+            signal: Trading signal to execute
+        """
+        # Get current volatility
+        market_data = await self.data_collector.fetch_historical_data(
+            signal.exchange, signal.trading_pair, '1d', 30
+        )
+        
+        volatility = 0.02  # Default volatility
+        if market_data and len(market_data) > 2:
+            # Calculate daily volatility using standard deviation of returns
+            n = len(market_data)
+            if n > self._price_buf.size:
+                self._price_buf = np.empty(n, dtype=np.float64)
+            prices = self._price_buf[:n]
+            for i, data in enumerate(market_data):
+                prices[i] = data.close_price
+            volatility = _volatility_kernel(prices)
+        
+        # Evaluate signal against risk parameters
+        is_allowed, adjusted_size, stop_loss = self.risk_manager.evaluate_signal(signal, volatility)
+        
+        if is_allowed:
+            # Adjust signal quantity
+            signal.quantity = adjusted_size
             
-            # Evaluate signal against risk parameters
-            is_allowed, adjusted_size, stop_loss = self.risk_manager.evaluate_signal(signal, volatility)
+            # Execute signal
+            order = await self.order_executor.execute_signal(signal)
             
-            if is_allowed:
-                # Adjust signal quantity
-                signal.quantity = adjusted_size
-                
-                # Execute signal
-                order = await self.order_executor.execute_signal(signal)
+            if order:
+                # Monitor order
+                self.monitoring_system.monitor_order(order)
                 
-                if order:
-                    # Monitor order
-                    self.monitoring_system.monitor_order(order)
-                    
-                    # Register position with risk manager if it's an entry
-                    if signal.signal_type == "ENTRY" and order.status == "FILLED":
-                        self.risk_manager.register_position(
-                            position_id=f"{order.exchange}:{order.trading_pair}",
-                            trading_pair=order.trading_pair,
-                            size=order.filled_quantity,
-                            entry_price=order.average_fill_price,
-                            direction=signal.direction
-                        )
+                # Register position with risk manager if it's an entry
+                if signal.signal_type == "ENTRY" and order.status == "FILLED":
+                    self.risk_manager.register_position(
+                        position_id=self._position_id(order.exchange, order.trading_pair),
+                        trading_pair=order.trading_pair,
+                        size=order.filled_quantity,
+                        entry_price=order.average_fill_price,
+                        direction=signal.direction,
+                        exchange=order.exchange
+                    )
     
     async def _update_positions(self) -> None:
         """Update positions with current market prices."""
-        if self.config.get('mode', 'paper') == 'paper':
+        if self.paper_mode:
             # Paper trading mode - positions are updated by paper trading system
             return
         
         # Live trading mode
         positions = self.order_executor.get_positions()
         
-        for position in positions:
-            # Get current price
-            ticker = await self.data_collector.fetch_ticker(position.exchange, position.trading_pair)
+        # Fetch current prices for all positions concurrently
+        tickers = await asyncio.gather(
+            *(self.data_collector.fetch_ticker(position.exchange, position.trading_pair) for position in positions),
+            return_exceptions=True
+        )
+        
+        priced = []
+        for position, ticker in zip(positions, tickers):
+            if isinstance(ticker, Exception):
+                logger.error(f"Error fetching ticker for {position.trading_pair} on {position.exchange}: {ticker}")
+                continue
             if ticker:
-                # Monitor position
-                self.monitoring_system.monitor_position(position, ticker.close_price)
-                
-                # Update position risk
-                position_id = f"{position.exchange}:{position.trading_pair}"
-                current_stop = position.stop_loss_price
-                
-                new_stop = self.risk_manager.update_position_risk(
-                    position_id, ticker.close_price, current_stop
-                )
-                
-                if new_stop and new_stop != current_stop:
-                    position.stop_loss_price = new_stop
-                    logger.info(f"Updated stop-loss for {position_id}: {new_stop}")
+                self._cache_ticker(ticker)
+                priced.append((position, ticker.close_price))
+        
+        # Monitor all priced positions in one batch
+        self.monitoring_system.monitor_positions(
+            [position for position, _ in priced],
+            np.array([price for _, price in priced], dtype=np.float64)
+        )
+        
+        # Update position risk and trailing stops for all priced positions in one call
+        by_id = {}
+        prices = {}
+        stops = {}
+        for position, price in priced:
+            position_id = position.id or self._position_id(position.exchange, position.trading_pair)
+            by_id[position_id] = position
+            prices[position_id] = price
+            if position.stop_loss is not None:
+                stops[position_id] = position.stop_loss
+        
+        for position_id, new_stop in self.risk_manager.refresh_trailing_stops(prices, stops).items():
+            by_id[position_id].stop_loss = new_stop
+            logger.info(f"Updated stop-loss for {position_id}: {new_stop}")
     
     async def _update_orders(self) -> None:
         """Update order statuses."""
-        if self.config.get('mode', 'paper') == 'paper':
+        if self.paper_mode:
             # Paper trading mode - orders are updated by paper trading system
             return
         
@@ -316,7 +486,7 @@ class TradingBot:
     
     async def _update_account_status(self) -> None:
         """Update account status."""
-        if self.config.get('mode', 'paper') == 'paper':
+        if self.paper_mode:
             # Paper trading mode - account status is updated by paper trading system
             return
         
@@ -324,18 +494,60 @@ class TradingBot:
         # Calculate total balance
         total_balance = 0.0
         
-        for exchange_name, exchange in self.exchanges.items():
-            balances = await exchange.fetch_balance()
-            
-            # Convert all balances to USD (simplified)
+        # Fetch balances from all exchanges concurrently
+        exchange_names = list(self.exchanges.keys())
+        all_balances = await asyncio.gather(
+            *(exchange.fetch_balance() for exchange in self.exchanges.values()),
+            return_exceptions=True
+        )
+        
+        # A partial total would look like a capital drop to the drawdown and circuit
+        # breaker checks, so skip this cycle's update if any exchange failed
+        failed = False
+        for exchange_name, balances in zip(exchange_names, all_balances):
+            if isinstance(balances, Exception):
+                logger.error(f"Error fetching balance on {exchange_name}: {balances}")
+                failed = True
+        if failed:
+            return
+        
+        # Convert all balances to USD (simplified)
+        conversions = []
+        for exchange_name, balances in zip(exchange_names, all_balances):
             for currency, amount in balances.items():
                 if currency == 'USDT' or currency == 'USD':
                     total_balance += amount
                 else:
-                    # Get ticker for currency/USDT
-                    ticker = await self.data_collector.fetch_ticker(exchange_name, f"{currency}/USDT")
-                    if ticker:
-                        total_balance += amount * ticker.close_price
+                    conversions.append((exchange_name, currency, amount))
+        
+        # Use cached currency/USDT prices where fresh, fetch the rest concurrently
+        now = time.monotonic()
+        stale = []
+        for exchange_name, currency, amount in conversions:
+            cached = self._ticker_cache.get((exchange_name, f"{currency}/USDT"))
+            if cached and now - cached[1] <= TICKER_CACHE_TTL:
+                total_balance += amount * cached[0]
+            else:
+                stale.append((exchange_name, currency, amount))
+        
+        tickers = await asyncio.gather(
+            *(self.data_collector.fetch_ticker(exchange_name, f"{currency}/USDT")
+              for exchange_name, currency, _ in stale),
+            return_exceptions=True
+        )
+        
+        failed = False
+        for (exchange_name, currency, _), ticker in zip(stale, tickers):
+            if isinstance(ticker, Exception):
+                logger.error(f"Error fetching ticker for {currency}/USDT on {exchange_name}: {ticker}")
+                failed = True
+        if failed:
+            return
+        
+        for (exchange_name, currency, amount), ticker in zip(stale, tickers):
+            if ticker:
+                self._cache_ticker(ticker)
+                total_balance += amount * ticker.close_price
         
         # Update risk manager and monitoring system
         self.risk_manager.update_account_status(total_balance)
@@ -344,23 +556,24 @@ class TradingBot:
     async def _run_trading_cycle(self) -> None:
         """Run a complete trading cycle."""
         try:
-            # Process market data
-            await self._process_market_data()
-            
-            # Generate signals
-            await self._generate_signals()
+            # Poll market data and generate signals; streamed exchanges are handled by their consumers
+            if any(self._polled_pairs_by_exchange.values()):
+                await self._process_market_data()
+                await self._generate_signals()
             
             # Execute signals
             await self._execute_signals()
             
-            # Update positions
-            await self._update_positions()
-            
-            # Update orders
-            await self._update_orders()
-            
-            # Update account status
-            await self._update_account_status()
+            # Update positions, orders and account status concurrently - they are independent
+            results = await asyncio.gather(
+                self._update_positions(),
+                self._update_orders(),
+                self._update_account_status(),
+                return_exceptions=True
+            )
+            for step, result in zip(('positions', 'orders', 'account status'), results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error updating {step}: {result}")
             
             logger.info("Trading cycle completed")
         except Exception as e:
@@ -375,6 +588,9 @@ class TradingBot:
         self.running = True
         logger.info("Starting trading bot")
         
+        # Compile the volatility kernel up front rather than on the first signal
+        _volatility_kernel(np.array([1.0, 1.01]))
+        
         # Load strategies
         await self._load_strategies()
         
@@ -384,32 +600,49 @@ class TradingBot:
         )
         
         # Start paper trading system if in paper mode
-        if self.config.get('mode', 'paper') == 'paper':
+        if self.paper_mode:
             paper_trading_task = asyncio.create_task(
                 self.paper_trading_system.run_paper_trading(self.signals_queue)
             )
         
-        # Start data collection
+        # Start data collection, subscribing once per pair even if several exchanges list it
         data_collection_task = asyncio.create_task(
             self.data_collector.start_data_collection(
-                trading_pairs=[pair for exchange in self.exchanges.values() for pair in exchange.exchange.trading_pairs],
+                trading_pairs=sorted({pair for exchange in self.exchanges.values() for pair in exchange.exchange.trading_pairs}),
                 intervals=['1m', '5m', '15m', '1h', '4h', '1d']
             )
         )
         
-        # Main trading loop
+        # Stream tickers for exchanges with a WebSocket endpoint whose adapter implements stream_tickers
+        ws_tasks = [
+            asyncio.create_task(self._ws_consumer(exchange_name))
+            for exchange_name in self._streamed_exchanges
+            if self._pairs_by_exchange.get(exchange_name)
+        ]
+        
+        # Main trading loop, run on a fixed cadence so cycle duration doesn't add drift
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
         try:
             while self.running:
                 await self._run_trading_cycle()
-                await asyncio.sleep(60)  # Run trading cycle every minute
+                
+                next_tick += TRADING_CYCLE_INTERVAL
+                now = loop.time()
+                if next_tick < now:
+                    # Cycle overran the interval - drop the missed ticks rather than catching up
+                    next_tick = now
+                await asyncio.sleep(next_tick - now)
         except asyncio.CancelledError:
             logger.info("Trading bot stopped")
         finally:
             # Cancel all tasks
             monitoring_task.cancel()
             data_collection_task.cancel()
+            for ws_task in ws_tasks:
+                ws_task.cancel()
             
-            if self.config.get('mode', 'paper') == 'paper':
+            if self.paper_mode:
                 paper_trading_task.cancel()
             
             self.running = False
@@ -435,17 +668,11 @@ async def main():
     # Create and start trading bot
     bot = TradingBot(args.config)
     
-    # Handle shutdown signals
-    loop = asyncio.get_event_loop()
-    
-    def signal_handler():
-        logger.info("Shutdown signal received")
-        bot.stop()
-    
-    # Only add signal handlers on Unix-like systems
+    # Handle shutdown signals - only supported on Unix-like systems
     if sys.platform != 'win32':
+        loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, signal_handler)
+            loop.add_signal_handler(sig, bot.stop)
     
     try:
         await bot.start()
@@ -459,4 +686,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use the libuv-based event loop when available
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
@@ -3,11 +3,15 @@ Base data models for the cryptocurrency trading bot.
 These models define the core data structures used throughout the application.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Union
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a per-instance __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class OrderType(Enum):
     """Order types supported by exchanges."""
@@ -229,9 +233,9 @@ class PerformanceMetrics:
     volatility: float = 0.0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Alert:
-    """Represents an alert or notification."""
+    """Represents an alert or notification. Slotted, since thousands are kept in memory."""
     type: AlertType
     source: str
     message: str
@@ -240,3 +244,4 @@ class Alert:
     related_entity_id: Optional[str] = None
     severity: int = 1  # 1-5
     id: Optional[str] = None
+    duplicate_count: int = 0  # Identical alerts folded into this one
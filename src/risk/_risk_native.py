@@ -0,0 +1,27 @@
+"""
+Ahead-of-time build of the risk kernels with numba.pycc.
+Run ``python -m src.risk._risk_native`` to produce the ``risk_native`` extension next to this
+module; risk_manager uses it when present so no JIT compilation happens at runtime.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from .risk_manager import _JIT_KERNELS
+
+# Exported kernel name -> fixed signature
+SIGNATURES = {
+    'calc_position_size': 'f8(f8,f8,f8,f8,b1)',
+    'scan_max_dd_period': 'Tuple((f8,i8))(i8[:],f8[:],i8,i8,i8)',
+}
+
+cc = CC('risk_native')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+for name, signature in SIGNATURES.items():
+    cc.export(name, signature)(_JIT_KERNELS[name].py_func)
+
+
+if __name__ == '__main__':
+    cc.compile()
@@ -4,14 +4,18 @@ This module implements risk management features to protect capital and ensure su
 """
 
 import logging
+import time
 import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
+
 from ..models.base_models import (
     Order, OrderSide, OrderStatus, OrderType, Position, PositionSide, Signal, SignalType
 )
 from ..data.data_collector import DataCollector
+from ..utils.jit import njit
 
 # Configure logging
 logging.basicConfig(
@@ -20,10 +24,130 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+DRAWDOWN_HISTORY_SIZE = 1000  # Number of recent drawdown points kept
+EXPOSURE_RESYNC_INTERVAL = 10000  # Price updates between full exposure recomputes
+NS_PER_DAY = 86_400_000_000_000
+NS_PER_WEEK = 7 * NS_PER_DAY
+
+
+# Integer direction codes used on hot paths instead of PositionSide comparisons
+LONG = 1
+SHORT = -1
+
+
+def _direction_code(direction: Union[PositionSide, int]) -> int:
+    """
+    Convert a position direction to its integer code.
+    
+    Args:
+        direction: PositionSide or an existing direction code
+        
+    Returns:
+        LONG (1) or SHORT (-1)
+    """
+    if isinstance(direction, int):
+        return direction
+    return LONG if direction == PositionSide.LONG else SHORT
+
+
+@njit('f8(f8,f8,f8,f8,b1)', cache=True, fastmath=True, nogil=True)
+def _calc_position_size(
+    available_capital: float,
+    risk_per_trade: float,
+    max_position_size: float,
+    volatility: float,
+    volatility_scaling: bool
+) -> float:
+    """
+    Calculate a position size from risk parameters.
+    
+    Args:
+        available_capital: Available capital for trading
+        risk_per_trade: Fraction of capital at risk per trade
+        max_position_size: Maximum position size as a fraction of capital
+        volatility: Current volatility measure
+        volatility_scaling: Whether to scale the position inversely to volatility
+        
+    Returns:
+        Position size
+    """
+    # Base position size (without volatility scaling)
+    base_position_size = available_capital * max_position_size
+    
+    # Apply volatility scaling if enabled - higher volatility means smaller position.
+    # Both branches are already capped at the base (maximum) position size.
+    if volatility_scaling and volatility > 0.0:
+        return min(base_position_size, available_capital * risk_per_trade / volatility)
+    return base_position_size
+
+
+@njit(cache=True, nogil=True)
+def _scan_max_dd_period(ts: np.ndarray, dd: np.ndarray, head: int, n: int, now_ns: int) -> Tuple[float, int]:
+    """
+    Find the maximum drawdown and the longest drawdown period in a ring buffer history.
+    
+    Args:
+        ts: Ring buffer of timestamps in nanoseconds
+        dd: Ring buffer of drawdowns at each timestamp
+        head: Slot the next entry will be written to
+        n: Number of valid entries
+        now_ns: Current time in nanoseconds (closes an open drawdown period)
+        
+    Returns:
+        Tuple of (max drawdown, longest duration in nanoseconds)
+    """
+    max_drawdown = 0.0
+    max_duration = 0
+    in_drawdown = False
+    drawdown_start = 0
+    
+    # Walk the ring in time order, starting from the oldest entry
+    capacity = ts.shape[0]
+    start = (head - n) % capacity
+    for k in range(n):
+        i = (start + k) % capacity
+        drawdown = dd[i]
+        if drawdown > 0 and not in_drawdown:
+            in_drawdown = True
+            drawdown_start = ts[i]
+        elif drawdown == 0 and in_drawdown:
+            duration = ts[i] - drawdown_start
+            if duration > max_duration:
+                max_duration = duration
+            in_drawdown = False
+        
+        if drawdown > max_drawdown:
+            max_drawdown = drawdown
+    
+    # Check if we're still in a drawdown period
+    if in_drawdown:
+        duration = now_ns - drawdown_start
+        if duration > max_duration:
+            max_duration = duration
+    
+    return max_drawdown, max_duration
+
+
+# JIT kernels by exported name, used by the ahead-of-time build in _risk_native
+_JIT_KERNELS = {
+    'calc_position_size': _calc_position_size,
+    'scan_max_dd_period': _scan_max_dd_period,
+}
+
+# Prefer the ahead-of-time compiled kernels when they have been built
+try:
+    from . import risk_native
+    _calc_position_size = risk_native.calc_position_size
+    _scan_max_dd_period = risk_native.scan_max_dd_period
+except ImportError:
+    pass
+
 
 class PositionSizer:
     """Calculates appropriate position sizes based on risk parameters."""
     
+    __slots__ = ('risk_per_trade', 'max_position_size', 'volatility_scaling', 'target_volatility')
+    
     def __init__(self, config: Dict):
         """
         Initialize the position sizer.
@@ -57,25 +181,16 @@ class PositionSizer:
         Returns:
             Recommended position size
         """
-        # Calculate maximum capital at risk
-        max_capital_at_risk = available_capital * self.risk_per_trade
-        
-        # Base position size (without volatility scaling)
-        base_position_size = available_capital * self.max_position_size
-        
-        # Apply volatility scaling if enabled
-        if self.volatility_scaling and volatility > 0:
-            # Inverse relationship with volatility - higher volatility means smaller position
-            volatility_scalar = self.target_volatility / volatility
-            position_size = min(base_position_size, max_capital_at_risk / volatility)
-        else:
-            position_size = base_position_size
-        
-        # Ensure position size doesn't exceed maximum
-        position_size = min(position_size, available_capital * self.max_position_size)
+        position_size = _calc_position_size(
+            float(available_capital),
+            float(self.risk_per_trade),
+            float(self.max_position_size),
+            float(volatility),
+            bool(self.volatility_scaling)
+        )
         
-        logger.info(f"Calculated position size for {trading_pair}: {position_size} "
-                   f"(volatility: {volatility:.4f}, risk: {self.risk_per_trade:.2f})")
+        logger.info("Calculated position size for %s: %s (volatility: %.4f, risk: %.2f)",
+                    trading_pair, position_size, volatility, self.risk_per_trade)
         
         return position_size
 
@@ -83,6 +198,8 @@ class PositionSizer:
 class StopLossManager:
     """Manages stop-loss levels for open positions."""
     
+    __slots__ = ('risk_multiplier', 'trailing_stop_enabled', 'trailing_stop_percent')
+    
     def __init__(self, config: Dict):
         """
         Initialize the stop-loss manager.
@@ -97,7 +214,7 @@ class StopLossManager:
     def calculate_stop_loss(
         self,
         entry_price: float,
-        direction: PositionSide,
+        direction: Union[PositionSide, int],
         volatility: float
     ) -> float:
         """
@@ -105,26 +222,25 @@ class StopLossManager:
         
         Args:
             entry_price: Position entry price
-            direction: "LONG" or "SHORT"
+            direction: PositionSide or direction code (LONG / SHORT)
             volatility: Current volatility measure (e.g., ATR)
             
         Returns:
             Stop-loss price level
         """
-        if direction == PositionSide.LONG:
-            stop_loss = entry_price - (volatility * self.risk_multiplier)
-        else:  # SHORT
-            stop_loss = entry_price + (volatility * self.risk_multiplier)
+        # Below entry for LONG, above entry for SHORT
+        code = _direction_code(direction)
+        stop_loss = entry_price - code * volatility * self.risk_multiplier
         
-        logger.info(f"Calculated stop-loss for {direction.value} position at {entry_price}: {stop_loss} "
-                   f"(volatility: {volatility:.4f}, multiplier: {self.risk_multiplier})")
+        logger.info("Calculated stop-loss for %s position at %s: %s (volatility: %.4f, multiplier: %s)",
+                    "LONG" if code > 0 else "SHORT", entry_price, stop_loss, volatility, self.risk_multiplier)
         
         return stop_loss
     
     def update_trailing_stop(
         self,
         current_price: float,
-        direction: PositionSide,
+        direction: Union[PositionSide, int],
         current_stop: float
     ) -> float:
         """
@@ -132,7 +248,7 @@ class StopLossManager:
         
         Args:
             current_price: Current market price
-            direction: "LONG" or "SHORT"
+            direction: PositionSide or direction code (LONG / SHORT)
             current_stop: Current stop-loss level
             
         Returns:
@@ -141,49 +257,234 @@ class StopLossManager:
         if not self.trailing_stop_enabled:
             return current_stop
         
-        if direction == PositionSide.LONG:
-            trail_level = current_price * (1 - self.trailing_stop_percent)
+        code = _direction_code(direction)
+        trail_level = current_price * (1 - code * self.trailing_stop_percent)
+        
+        if code > 0:
             new_stop = max(current_stop, trail_level)
             
-            if new_stop > current_stop:
-                logger.info(f"Updated trailing stop for LONG position: {current_stop} -> {new_stop} "
-                           f"(current price: {current_price})")
+            if new_stop > current_stop and logger.isEnabledFor(logging.INFO):
+                logger.info("Updated trailing stop for LONG position: %s -> %s (current price: %s)",
+                            current_stop, new_stop, current_price)
             
             return new_stop
         else:  # SHORT
-            trail_level = current_price * (1 + self.trailing_stop_percent)
             new_stop = min(current_stop, trail_level)
             
-            if new_stop < current_stop:
-                logger.info(f"Updated trailing stop for SHORT position: {current_stop} -> {new_stop} "
-                           f"(current price: {current_price})")
+            if new_stop < current_stop and logger.isEnabledFor(logging.INFO):
+                logger.info("Updated trailing stop for SHORT position: %s -> %s (current price: %s)",
+                            current_stop, new_stop, current_price)
             
             return new_stop
+    
+    def update_trailing_stops_batch(
+        self,
+        prices: np.ndarray,
+        is_long: np.ndarray,
+        stops: np.ndarray
+    ) -> np.ndarray:
+        """
+        Update trailing stop-loss levels for many positions in one vectorized pass.
+        
+        Args:
+            prices: Current market price per position
+            is_long: Boolean mask, True for LONG positions
+            stops: Current stop-loss level per position
+            
+        Returns:
+            Updated stop-loss levels
+        """
+        if not self.trailing_stop_enabled:
+            return stops.copy()
+        
+        long_trail = np.maximum(stops, prices * (1 - self.trailing_stop_percent))
+        short_trail = np.minimum(stops, prices * (1 + self.trailing_stop_percent))
+        
+        return np.where(is_long, long_trail, short_trail)
 
 
 class RiskExposureMonitor:
     """Tracks and limits overall risk exposure."""
     
-    def __init__(self, config: Dict):
+    __slots__ = (
+        'max_total_exposure', 'correlation_threshold', 'total_capital', '_inv_capital', '_exposure_cap',
+        '_sizes', '_prices', '_entry_prices', '_directions', '_pairs', '_exchanges', '_ids', '_id_to_idx', '_n',
+        '_exposure_value', '_updates_since_resync',
+        '_pair_counts', '_correlation_cached', '_correlation_dirty',
+        '_pair_index', '_pair_index_dirty'
+    )
+    
+    def __init__(self, config: Dict, capacity: int = 16):
         """
         Initialize the risk exposure monitor.
         
         Args:
             config: Risk configuration parameters
+            capacity: Initial number of position slots (grows as needed)
         """
         self.max_total_exposure = config.get('max_exposure', 0.5)  # Default 50% max exposure
         self.correlation_threshold = config.get('correlation_threshold', 0.7)
-        self.positions = {}  # Dict of position_id -> position details
         self.total_capital = 0.0
+        self._inv_capital = 0.0  # 1 / total_capital (0 when unset)
+        self._exposure_cap = 0.0  # Maximum exposure value: total_capital * max_total_exposure
+        
+        # Positions are stored as parallel arrays (one dense row per position)
+        # so exposure can be computed as a single dot product
+        self._sizes = np.zeros(capacity, dtype=np.float64)
+        self._prices = np.zeros(capacity, dtype=np.float64)
+        self._entry_prices = np.zeros(capacity, dtype=np.float64)
+        self._directions = np.zeros(capacity, dtype=np.int8)  # LONG / SHORT codes
+        self._pairs = np.empty(capacity, dtype=object)
+        self._exchanges = np.empty(capacity, dtype=object)  # Exchange holding each position, if known
+        self._ids = np.empty(capacity, dtype=object)
+        self._id_to_idx = {}  # Dict of position_id -> row index
+        self._n = 0
+        
+        # Running sum of size * current_price, kept in step with the arrays
+        self._exposure_value = 0.0
+        self._updates_since_resync = 0
+        
+        # Open positions per trading pair, and the correlation derived from them
+        self._pair_counts = {}  # Dict of trading_pair -> position count
+        self._correlation_cached = 0.0
+        self._correlation_dirty = False
+        
+        # Rows per (exchange, trading pair) for bulk price updates, rebuilt lazily after structural changes
+        self._pair_index = {}  # Dict of (exchange, trading_pair) -> array of row indices
+        self._pair_index_dirty = True
+    
+    @property
+    def position_count(self) -> int:
+        """Number of positions being monitored."""
+        return self._n
+    
+    @property
+    def positions(self) -> Dict[str, Dict]:
+        """Snapshot of all positions as position_id -> position details."""
+        return {self._ids[idx]: self._position_details(idx) for idx in range(self._n)}
+    
+    def _position_details(self, idx: int) -> Dict:
+        """
+        Build the details dictionary for a position row.
+        
+        Args:
+            idx: Row index
+            
+        Returns:
+            Position details
+        """
+        return {
+            'trading_pair': self._pairs[idx],
+            'size': float(self._sizes[idx]),
+            'entry_price': float(self._entry_prices[idx]),
+            'direction': PositionSide.LONG if self._directions[idx] == LONG else PositionSide.SHORT,
+            'current_price': float(self._prices[idx])
+        }
+    
+    def get_position_index(self, position_id: str) -> Optional[int]:
+        """
+        Get the array row of a position.
+        
+        Args:
+            position_id: Position identifier
+            
+        Returns:
+            Row index or None if not found
+        """
+        return self._id_to_idx.get(position_id)
+    
+    def get_direction(self, position_id: str) -> Optional[int]:
+        """
+        Get the direction code of a position.
+        
+        Args:
+            position_id: Position identifier
+            
+        Returns:
+            LONG (1) or SHORT (-1), or None if not found
+        """
+        idx = self._id_to_idx.get(position_id)
+        if idx is None:
+            return None
+        return int(self._directions[idx])
+    
+    def get_position(self, position_id: str) -> Optional[Dict]:
+        """
+        Get details for a position.
+        
+        Args:
+            position_id: Position identifier
+            
+        Returns:
+            Position details or None if not found
+        """
+        idx = self._id_to_idx.get(position_id)
+        if idx is None:
+            return None
+        return self._position_details(idx)
+    
+    def get_directions(self, position_ids: List[str]) -> np.ndarray:
+        """
+        Get direction codes for a set of monitored positions.
+        
+        Args:
+            position_ids: Identifiers of monitored positions
+            
+        Returns:
+            Array of direction codes (1 = LONG, -1 = SHORT)
+        """
+        idx = np.fromiter(
+            (self._id_to_idx[position_id] for position_id in position_ids),
+            dtype=np.intp, count=len(position_ids)
+        )
+        return self._directions[idx]
+    
+    def _grow(self) -> None:
+        """Double the capacity of the position arrays."""
+        capacity = self._sizes.size * 2
+        self._sizes = np.resize(self._sizes, capacity)
+        self._prices = np.resize(self._prices, capacity)
+        self._entry_prices = np.resize(self._entry_prices, capacity)
+        self._directions = np.resize(self._directions, capacity)
+        self._pairs = np.resize(self._pairs, capacity)
+        self._exchanges = np.resize(self._exchanges, capacity)
+        self._ids = np.resize(self._ids, capacity)
+    
+    def _release_pair(self, trading_pair: str) -> None:
+        """
+        Decrement the open position count of a trading pair.
+        
+        Args:
+            trading_pair: Trading pair of the position being released
+        """
+        count = self._pair_counts[trading_pair] - 1
+        if count:
+            self._pair_counts[trading_pair] = count
+        else:
+            del self._pair_counts[trading_pair]
+    
+    def _resync_exposure(self) -> None:
+        """Recompute the running exposure value from the position arrays."""
+        n = self._n
+        self._exposure_value = float(self._sizes[:n] @ self._prices[:n])
+        self._updates_since_resync = 0
     
     def set_total_capital(self, capital: float) -> None:
         """
         Set the total capital available.
         
         Args:
-            capital: Total capital amount
+            capital: Total capital amount (must be positive)
+            
+        Raises:
+            ValueError: If capital is not positive
         """
+        if capital <= 0:
+            raise ValueError(f"Total capital must be positive: {capital}")
+        
         self.total_capital = capital
+        self._inv_capital = 1.0 / capital
+        self._exposure_cap = capital * self.max_total_exposure
     
     def add_position(
         self,
@@ -191,7 +492,8 @@ class RiskExposureMonitor:
         trading_pair: str,
         size: float,
         entry_price: float,
-        direction: PositionSide
+        direction: PositionSide,
+        exchange: Optional[str] = None
     ) -> None:
         """
         Add a new position to the monitor.
@@ -202,16 +504,34 @@ class RiskExposureMonitor:
             size: Position size
             entry_price: Entry price
             direction: Position direction
+            exchange: Exchange holding the position, for per-exchange bulk price updates
         """
-        self.positions[position_id] = {
-            'trading_pair': trading_pair,
-            'size': size,
-            'entry_price': entry_price,
-            'direction': direction,
-            'current_price': entry_price
-        }
-        
-        logger.info(f"Added position to risk monitor: {position_id} ({trading_pair}, {direction.value}, {size})")
+        idx = self._id_to_idx.get(position_id)
+        if idx is None:
+            if self._n == self._sizes.size:
+                self._grow()
+            idx = self._n
+            self._n += 1
+            self._id_to_idx[position_id] = idx
+            self._ids[idx] = position_id
+        else:
+            # Replacing an existing position - drop its old contribution
+            self._exposure_value -= self._sizes[idx] * self._prices[idx]
+            self._release_pair(self._pairs[idx])
+        
+        self._exposure_value += size * entry_price
+        self._pair_counts[trading_pair] = self._pair_counts.get(trading_pair, 0) + 1
+        self._correlation_dirty = True
+        self._pair_index_dirty = True
+        self._pairs[idx] = trading_pair
+        self._exchanges[idx] = exchange
+        self._sizes[idx] = size
+        self._entry_prices[idx] = entry_price
+        self._prices[idx] = entry_price
+        self._directions[idx] = _direction_code(direction)
+        
+        logger.info("Added position to risk monitor: %s (%s, %s, %s)",
+                    position_id, trading_pair, direction.value, size)
     
     def update_position(self, position_id: str, current_price: float) -> None:
         """
@@ -221,8 +541,50 @@ class RiskExposureMonitor:
             position_id: Position identifier
             current_price: Current market price
         """
-        if position_id in self.positions:
-            self.positions[position_id]['current_price'] = current_price
+        idx = self._id_to_idx.get(position_id)
+        if idx is not None:
+            self._exposure_value += self._sizes[idx] * (current_price - self._prices[idx])
+            self._prices[idx] = current_price
+            
+            # Periodically recompute from scratch to bound floating-point drift
+            self._updates_since_resync += 1
+            if self._updates_since_resync >= EXPOSURE_RESYNC_INTERVAL:
+                self._resync_exposure()
+    
+    def update_positions_by_pair(self, exchange: str, trading_pair: str, current_price: float) -> None:
+        """
+        Update every position in a trading pair on an exchange with the current market price.
+        
+        Args:
+            exchange: Exchange the price was quoted on
+            trading_pair: Trading pair
+            current_price: Current market price
+        """
+        if self._pair_index_dirty:
+            self._rebuild_pair_index()
+        
+        rows = self._pair_index.get((exchange, trading_pair))
+        if rows is None:
+            return
+        
+        self._exposure_value += float(self._sizes[rows] @ (current_price - self._prices[rows]))
+        self._prices[rows] = current_price
+        
+        # Periodically recompute from scratch to bound floating-point drift
+        self._updates_since_resync += rows.size
+        if self._updates_since_resync >= EXPOSURE_RESYNC_INTERVAL:
+            self._resync_exposure()
+    
+    def _rebuild_pair_index(self) -> None:
+        """Rebuild the (exchange, trading pair) -> rows index from the position arrays."""
+        rows_by_pair = {}
+        for idx in range(self._n):
+            rows_by_pair.setdefault((self._exchanges[idx], self._pairs[idx]), []).append(idx)
+        
+        self._pair_index = {
+            key: np.array(rows, dtype=np.intp) for key, rows in rows_by_pair.items()
+        }
+        self._pair_index_dirty = False
     
     def remove_position(self, position_id: str) -> None:
         """
@@ -231,9 +593,33 @@ class RiskExposureMonitor:
         Args:
             position_id: Position identifier
         """
-        if position_id in self.positions:
-            logger.info(f"Removed position from risk monitor: {position_id}")
-            del self.positions[position_id]
+        idx = self._id_to_idx.pop(position_id, None)
+        if idx is None:
+            return
+        
+        logger.info(f"Removed position from risk monitor: {position_id}")
+        
+        self._exposure_value -= self._sizes[idx] * self._prices[idx]
+        self._release_pair(self._pairs[idx])
+        self._correlation_dirty = True
+        self._pair_index_dirty = True
+        
+        # Move the last row into the freed slot to keep the arrays dense
+        last = self._n - 1
+        if idx != last:
+            self._sizes[idx] = self._sizes[last]
+            self._prices[idx] = self._prices[last]
+            self._entry_prices[idx] = self._entry_prices[last]
+            self._directions[idx] = self._directions[last]
+            self._pairs[idx] = self._pairs[last]
+            self._exchanges[idx] = self._exchanges[last]
+            self._ids[idx] = self._ids[last]
+            self._id_to_idx[self._ids[idx]] = idx
+        
+        self._pairs[last] = None
+        self._exchanges[last] = None
+        self._ids[last] = None
+        self._n = last
     
     def calculate_total_exposure(self) -> float:
         """
@@ -242,14 +628,7 @@ class RiskExposureMonitor:
         Returns:
             Total exposure as a percentage
         """
-        if self.total_capital <= 0:
-            return 0.0
-        
-        total_exposure = sum(
-            pos['size'] * pos['current_price'] for pos in self.positions.values()
-        )
-        
-        return total_exposure / self.total_capital if self.total_capital > 0 else 0.0
+        return self._exposure_value * self._inv_capital
     
     def is_new_position_allowed(self, size: float, price: float) -> bool:
         """
@@ -262,13 +641,11 @@ class RiskExposureMonitor:
         Returns:
             True if position is allowed, False otherwise
         """
-        current_exposure = self.calculate_total_exposure()
-        new_position_value = size * price
-        new_exposure = current_exposure + (new_position_value / self.total_capital if self.total_capital > 0 else 0)
-        
-        allowed = new_exposure <= self.max_total_exposure
+        new_exposure_value = self._exposure_value + size * price
+        allowed = new_exposure_value <= self._exposure_cap
         
         if not allowed:
+            new_exposure = new_exposure_value * self._inv_capital
             logger.warning(f"New position rejected: would exceed max exposure "
                           f"({new_exposure:.2f} > {self.max_total_exposure:.2f})")
         
@@ -284,17 +661,21 @@ class RiskExposureMonitor:
         # This is a simplified implementation
         # A real implementation would analyze price correlation between held assets
         
-        # Count unique trading pairs
-        unique_pairs = set(pos['trading_pair'] for pos in self.positions.values())
+        # Only recomputed when positions are added or removed
+        if not self._correlation_dirty:
+            return self._correlation_cached
         
-        if len(self.positions) <= 1:
-            return 0.0
-        
-        # Simple diversification measure: unique pairs / total positions
-        diversification = len(unique_pairs) / len(self.positions)
+        if self._n <= 1:
+            correlation = 0.0
+        else:
+            # Simple diversification measure: unique pairs / total positions
+            diversification = len(self._pair_counts) / self._n
+            
+            # Convert to correlation (inverse of diversification)
+            correlation = 1.0 - diversification
         
-        # Convert to correlation (inverse of diversification)
-        correlation = 1.0 - diversification
+        self._correlation_cached = correlation
+        self._correlation_dirty = False
         
         return correlation
 
@@ -302,6 +683,8 @@ class RiskExposureMonitor:
 class DrawdownMonitor:
     """Tracks and manages drawdown."""
     
+    __slots__ = ('max_drawdown_percent', 'peak_capital', 'current_capital', '_inv_peak', '_ts', '_dd', '_head', '_len')
+    
     def __init__(self, config: Dict):
         """
         Initialize the drawdown monitor.
@@ -312,7 +695,13 @@ class DrawdownMonitor:
         self.max_drawdown_percent = config.get('max_drawdown', 0.5)  # Default 50% max drawdown
         self.peak_capital = 0.0
         self.current_capital = 0.0
-        self.drawdown_history = []  # List of (timestamp, drawdown) tuples
+        self._inv_peak = 0.0  # 1 / peak_capital (0 until a peak is recorded, so drawdown starts at 0)
+        
+        # Drawdown history as a ring buffer of nanosecond timestamps and drawdowns
+        self._ts = np.empty(DRAWDOWN_HISTORY_SIZE, dtype=np.int64)
+        self._dd = np.empty(DRAWDOWN_HISTORY_SIZE, dtype=np.float64)
+        self._head = 0
+        self._len = 0
     
     def update_capital(self, current_capital: float) -> None:
         """
@@ -326,14 +715,15 @@ class DrawdownMonitor:
         # Update peak capital if current capital is higher
         if current_capital > self.peak_capital:
             self.peak_capital = current_capital
+            self._inv_peak = 1.0 / current_capital
         
-        # Record drawdown
+        # Record drawdown, overwriting the oldest point once the history is full
         drawdown = self.calculate_drawdown()
-        self.drawdown_history.append((datetime.now(), drawdown))
-        
-        # Keep only recent history (last 1000 points)
-        if len(self.drawdown_history) > 1000:
-            self.drawdown_history = self.drawdown_history[-1000:]
+        self._ts[self._head] = time.monotonic_ns()
+        self._dd[self._head] = drawdown
+        self._head = (self._head + 1) % DRAWDOWN_HISTORY_SIZE
+        if self._len < DRAWDOWN_HISTORY_SIZE:
+            self._len += 1
     
     def calculate_drawdown(self) -> float:
         """
@@ -342,10 +732,7 @@ class DrawdownMonitor:
         Returns:
             Current drawdown as a percentage
         """
-        if self.peak_capital == 0:
-            return 0.0
-        
-        return (self.peak_capital - self.current_capital) / self.peak_capital
+        return (self.peak_capital - self.current_capital) * self._inv_peak
     
     def is_max_drawdown_exceeded(self) -> bool:
         """
@@ -386,37 +773,26 @@ class DrawdownMonitor:
         Returns:
             Tuple of (max drawdown, duration)
         """
-        if not self.drawdown_history:
+        if self._len == 0:
             return 0.0, timedelta(0)
         
-        max_drawdown = 0.0
-        max_duration = timedelta(0)
-        drawdown_start = None
-        
-        for timestamp, drawdown in self.drawdown_history:
-            if drawdown > 0 and drawdown_start is None:
-                drawdown_start = timestamp
-            elif drawdown == 0 and drawdown_start is not None:
-                duration = timestamp - drawdown_start
-                if duration > max_duration:
-                    max_duration = duration
-                drawdown_start = None
-            
-            if drawdown > max_drawdown:
-                max_drawdown = drawdown
-        
-        # Check if we're still in a drawdown period
-        if drawdown_start is not None:
-            duration = datetime.now() - drawdown_start
-            if duration > max_duration:
-                max_duration = duration
+        max_drawdown, max_duration_ns = _scan_max_dd_period(
+            self._ts, self._dd, self._head, self._len, time.monotonic_ns()
+        )
         
-        return max_drawdown, max_duration
+        return max_drawdown, timedelta(microseconds=max_duration_ns // 1000)
 
 
 class CircuitBreaker:
     """Implements circuit breakers to pause trading during adverse conditions."""
     
+    __slots__ = (
+        'daily_loss_limit', 'weekly_loss_limit', 'volatility_limit',
+        'starting_capital', 'current_capital', 'daily_starting_capital', 'weekly_starting_capital',
+        '_inv_daily_start', '_inv_weekly_start', '_last_daily_reset_ns', '_last_weekly_reset_ns',
+        'circuit_broken', 'circuit_break_reason', 'circuit_break_time'
+    )
+    
     def __init__(self, config: Dict):
         """
         Initialize the circuit breaker.
@@ -432,8 +808,10 @@ class CircuitBreaker:
         self.current_capital = 0.0
         self.daily_starting_capital = 0.0
         self.weekly_starting_capital = 0.0
-        self.last_daily_reset = datetime.now()
-        self.last_weekly_reset = datetime.now()
+        self._inv_daily_start = 0.0  # 1 / daily_starting_capital (0 when unset)
+        self._inv_weekly_start = 0.0  # 1 / weekly_starting_capital (0 when unset)
+        self._last_daily_reset_ns = time.monotonic_ns()
+        self._last_weekly_reset_ns = self._last_daily_reset_ns
         self.circuit_broken = False
         self.circuit_break_reason = ""
         self.circuit_break_time = None
@@ -443,12 +821,38 @@ class CircuitBreaker:
         Set the starting capital.
         
         Args:
-            capital: Starting capital amount
+            capital: Starting capital amount (must be positive)
+            
+        Raises:
+            ValueError: If capital is not positive
         """
+        if capital <= 0:
+            raise ValueError(f"Starting capital must be positive: {capital}")
+        
         self.starting_capital = capital
         self.current_capital = capital
+        self._set_daily_starting_capital(capital)
+        self._set_weekly_starting_capital(capital)
+    
+    def _set_daily_starting_capital(self, capital: float) -> None:
+        """
+        Set the daily starting capital and its cached reciprocal.
+        
+        Args:
+            capital: Daily starting capital amount
+        """
         self.daily_starting_capital = capital
+        self._inv_daily_start = 1.0 / capital if capital > 0 else 0.0
+    
+    def _set_weekly_starting_capital(self, capital: float) -> None:
+        """
+        Set the weekly starting capital and its cached reciprocal.
+        
+        Args:
+            capital: Weekly starting capital amount
+        """
         self.weekly_starting_capital = capital
+        self._inv_weekly_start = 1.0 / capital if capital > 0 else 0.0
     
     def update_capital(self, current_capital: float) -> None:
         """
@@ -460,17 +864,17 @@ class CircuitBreaker:
         self.current_capital = current_capital
         
         # Check if we need to reset daily/weekly starting capital
-        now = datetime.now()
+        now_ns = time.monotonic_ns()
         
         # Daily reset
-        if (now - self.last_daily_reset).days >= 1:
-            self.daily_starting_capital = current_capital
-            self.last_daily_reset = now
+        if now_ns - self._last_daily_reset_ns >= NS_PER_DAY:
+            self._set_daily_starting_capital(current_capital)
+            self._last_daily_reset_ns = now_ns
         
         # Weekly reset
-        if (now - self.last_weekly_reset).days >= 7:
-            self.weekly_starting_capital = current_capital
-            self.last_weekly_reset = now
+        if now_ns - self._last_weekly_reset_ns >= NS_PER_WEEK:
+            self._set_weekly_starting_capital(current_capital)
+            self._last_weekly_reset_ns = now_ns
         
         # Check circuit breakers
         self._check_circuit_breakers()
@@ -481,14 +885,18 @@ class CircuitBreaker:
         if self.circuit_broken:
             return
         
+        # No loss against either reference - nothing to check
+        if self.current_capital >= self.daily_starting_capital and self.current_capital >= self.weekly_starting_capital:
+            return
+        
         # Check daily loss limit
-        daily_loss = (self.daily_starting_capital - self.current_capital) / self.daily_starting_capital
+        daily_loss = (self.daily_starting_capital - self.current_capital) * self._inv_daily_start
         if daily_loss > self.daily_loss_limit:
             self._break_circuit(f"Daily loss limit exceeded: {daily_loss:.2f} > {self.daily_loss_limit:.2f}")
             return
         
         # Check weekly loss limit
-        weekly_loss = (self.weekly_starting_capital - self.current_capital) / self.weekly_starting_capital
+        weekly_loss = (self.weekly_starting_capital - self.current_capital) * self._inv_weekly_start
         if weekly_loss > self.weekly_loss_limit:
             self._break_circuit(f"Weekly loss limit exceeded: {weekly_loss:.2f} > {self.weekly_loss_limit:.2f}")
             return
@@ -581,19 +989,21 @@ class RiskManager:
             volatility=volatility
         )
         
+        price = signal.price
+        if not price:
+            return True, position_size, None
+        
         # Check if new position would exceed exposure limits
-        if signal.price and not self.exposure_monitor.is_new_position_allowed(position_size, signal.price):
+        if not self.exposure_monitor.is_new_position_allowed(position_size, price):
             logger.warning("Signal rejected: would exceed exposure limits")
             return False, 0.0, None
         
         # Calculate stop-loss level
-        stop_loss = None
-        if signal.price:
-            stop_loss = self.stop_loss_manager.calculate_stop_loss(
-                entry_price=signal.price,
-                direction=signal.direction,
-                volatility=volatility
-            )
+        stop_loss = self.stop_loss_manager.calculate_stop_loss(
+            entry_price=price,
+            direction=signal.direction,
+            volatility=volatility
+        )
         
         return True, position_size, stop_loss
     
@@ -620,22 +1030,64 @@ class RiskManager:
         # Update trailing stop if applicable
         new_stop = None
         if current_stop is not None:
-            # Get position details
-            position = None
-            for pos_id, pos in self.exposure_monitor.positions.items():
-                if pos_id == position_id:
-                    position = pos
-                    break
+            # Get position direction
+            direction = self.exposure_monitor.get_direction(position_id)
             
-            if position:
+            if direction is not None:
                 new_stop = self.stop_loss_manager.update_trailing_stop(
                     current_price=current_price,
-                    direction=position['direction'],
+                    direction=direction,
                     current_stop=current_stop
                 )
         
         return new_stop
     
+    def update_pair_price(self, exchange: str, trading_pair: str, current_price: float) -> None:
+        """
+        Update every monitored position in a trading pair on an exchange with a new market price.
+        
+        Args:
+            exchange: Exchange the price was quoted on
+            trading_pair: Trading pair
+            current_price: Current market price
+        """
+        self.exposure_monitor.update_positions_by_pair(exchange, trading_pair, current_price)
+    
+    def refresh_trailing_stops(
+        self,
+        prices: Dict[str, float],
+        stops: Dict[str, float]
+    ) -> Dict[str, float]:
+        """
+        Update prices and trailing stops for many positions at once.
+        
+        Args:
+            prices: Dict of position_id -> current market price
+            stops: Dict of position_id -> current stop-loss level
+            
+        Returns:
+            Dict of position_id -> new stop-loss level for stops that moved
+        """
+        # Update positions in exposure monitor
+        for position_id, price in prices.items():
+            self.exposure_monitor.update_position(position_id, price)
+        
+        position_ids = [
+            position_id for position_id in stops
+            if position_id in prices and self.exposure_monitor.get_position_index(position_id) is not None
+        ]
+        if not position_ids:
+            return {}
+        
+        current_prices = np.fromiter((prices[pid] for pid in position_ids), dtype=np.float64, count=len(position_ids))
+        current_stops = np.fromiter((stops[pid] for pid in position_ids), dtype=np.float64, count=len(position_ids))
+        is_long = self.exposure_monitor.get_directions(position_ids) > 0
+        
+        new_stops = self.stop_loss_manager.update_trailing_stops_batch(current_prices, is_long, current_stops)
+        
+        moved = np.flatnonzero(new_stops != current_stops)
+        return {position_ids[i]: float(new_stops[i]) for i in moved}
+    
     def update_account_status(self, current_capital: float) -> None:
         """
         Update account status for risk monitoring.
@@ -644,7 +1096,10 @@ class RiskManager:
             current_capital: Current capital value
         """
         self.available_capital = current_capital
-        self.exposure_monitor.set_total_capital(current_capital)
+        if current_capital > 0:
+            self.exposure_monitor.set_total_capital(current_capital)
+        else:
+            logger.warning(f"Keeping previous total capital for exposure limits: reported capital is {current_capital}")
         self.drawdown_monitor.update_capital(current_capital)
         self.circuit_breaker.update_capital(current_capital)
     
@@ -654,7 +1109,8 @@ class RiskManager:
         trading_pair: str,
         size: float,
         entry_price: float,
-        direction: PositionSide
+        direction: PositionSide,
+        exchange: Optional[str] = None
     ) -> None:
         """
         Register a new position with the risk manager.
@@ -665,13 +1121,15 @@ class RiskManager:
             size: Position size
             entry_price: Entry price
             direction: Position direction
+            exchange: Exchange holding the position; only then do its pair's tickers re-mark it
         """
         self.exposure_monitor.add_position(
             position_id=position_id,
             trading_pair=trading_pair,
             size=size,
             entry_price=entry_price,
-            direction=direction
+            direction=direction,
+            exchange=exchange
         )
     
     def unregister_position(self, position_id: str) -> None:
@@ -694,7 +1152,7 @@ class RiskManager:
             'total_exposure': self.exposure_monitor.calculate_total_exposure(),
             'current_drawdown': self.drawdown_monitor.calculate_drawdown(),
             'recovery_factor': self.drawdown_monitor.get_recovery_factor(),
-            'position_count': len(self.exposure_monitor.positions),
+            'position_count': self.exposure_monitor.position_count,
             'is_max_drawdown_exceeded': self.drawdown_monitor.is_max_drawdown_exceeded(),
             'is_trading_allowed': self.circuit_breaker.is_trading_allowed(),
             'circuit_break_reason': self.circuit_breaker.circuit_break_reason,
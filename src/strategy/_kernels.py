@@ -0,0 +1,123 @@
+"""
+Compiled numeric kernels for the strategy engine.
+The ahead-of-time build from _kernels_aot is used when present, then the optional
+Cython volatility kernel in src.fastmath, otherwise numba JIT; without numba these
+run as plain Python functions.
+"""
+
+import math
+
+import numpy as np
+
+from ..utils.jit import njit
+
+
+@njit(cache=True, nogil=True)
+def _welford_update(count: int, mean: float, m2: float, x: float):
+    """
+    Fold one sample into Welford running moments.
+    
+    Args:
+        count: Samples seen so far
+        mean: Running mean
+        m2: Running sum of squared deviations from the mean
+        x: New sample
+        
+    Returns:
+        Tuple of updated (count, mean, m2)
+    """
+    count += 1
+    delta = x - mean
+    mean += delta / count
+    m2 += delta * (x - mean)
+    return count, mean, m2
+
+
+@njit(cache=True, nogil=True)
+def _welford_std(count: int, m2: float) -> float:
+    """
+    Sample standard deviation from Welford running moments.
+    
+    Args:
+        count: Samples seen
+        m2: Running sum of squared deviations from the mean
+        
+    Returns:
+        Sample standard deviation (0.0 if fewer than two samples)
+    """
+    if count < 2:
+        return 0.0
+    return math.sqrt(m2 / (count - 1))
+
+
+@njit(cache=True, nogil=True)
+def _volatility(prices: np.ndarray) -> float:
+    """
+    Calculate the sample standard deviation of simple returns in one pass.
+    
+    Uses Welford's update, which stays accurate when returns are nearly constant.
+    
+    Args:
+        prices: Close prices, oldest first
+        
+    Returns:
+        Standard deviation of returns (0.0 if fewer than two returns)
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(1, prices.shape[0]):
+        count, mean, m2 = _welford_update(count, mean, m2, prices[i] / prices[i - 1] - 1.0)
+    return _welford_std(count, m2)
+
+
+@njit(cache=True, nogil=True)
+def _ma_stats(prices: np.ndarray, short_window: int, long_window: int):
+    """
+    Compute both MA window sums and the returns volatility in one pass.
+    
+    Args:
+        prices: Close prices, oldest first (at least long_window of them)
+        short_window: Short MA period
+        long_window: Long MA period
+        
+    Returns:
+        Tuple of (short window sum, long window sum, volatility)
+    """
+    n = prices.shape[0]
+    short_start = n - short_window
+    long_start = n - long_window
+    
+    short_sum = 0.0
+    long_sum = 0.0
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        p = prices[i]
+        if i >= short_start:
+            short_sum += p
+        if i >= long_start:
+            long_sum += p
+        if i > 0:
+            count, mean, m2 = _welford_update(count, mean, m2, p / prices[i - 1] - 1.0)
+    
+    return short_sum, long_sum, _welford_std(count, m2)
+
+
+# JIT kernels by exported name, used by the ahead-of-time build in _kernels_aot
+_JIT_KERNELS = {
+    'volatility': _volatility,
+    'ma_stats': _ma_stats,
+}
+
+# Prefer the ahead-of-time compiled kernels when they have been built
+try:
+    from . import strategy_kernels
+    _volatility = strategy_kernels.volatility
+    _ma_stats = strategy_kernels.ma_stats
+except ImportError:
+    try:
+        from ..fastmath.volatility import daily_volatility as _volatility
+    except ImportError:
+        pass
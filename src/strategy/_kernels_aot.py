@@ -0,0 +1,27 @@
+"""
+Ahead-of-time build of the strategy kernels with numba.pycc.
+Run ``python -m src.strategy._kernels_aot`` to produce the ``strategy_kernels`` extension next to
+this module; _kernels uses it when present so no JIT compilation happens at runtime.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from ._kernels import _JIT_KERNELS
+
+# Exported kernel name -> fixed signature
+SIGNATURES = {
+    'volatility': 'f8(f8[:])',
+    'ma_stats': 'UniTuple(f8,3)(f8[:],i8,i8)',
+}
+
+cc = CC('strategy_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+for name, signature in SIGNATURES.items():
+    cc.export(name, signature)(_JIT_KERNELS[name].py_func)
+
+
+if __name__ == '__main__':
+    cc.compile()
@@ -4,15 +4,19 @@ This module implements the strategy framework for generating trading signals.
 """
 
 import abc
+import asyncio
 import logging
-import statistics
+from collections import defaultdict, deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
+
 from ..models.base_models import (
-    MarketData, Order, OrderSide, OrderType, Position, PositionSide, Signal, SignalType, Strategy, StrategyType, Trade
+    MarketData, Order, OrderSide, OrderStatus, OrderType, Position, PositionSide, Signal, SignalType, Strategy, StrategyType, Trade
 )
 from ..data.data_collector import DataCollector
+from ._kernels import _ma_stats, _volatility
 
 # Configure logging
 logging.basicConfig(
@@ -21,6 +25,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+MA_RESYNC_INTERVAL = 1000  # Bars between exact recomputes of the running MA sums
+
 
 class StrategyBase(abc.ABC):
     """Abstract base class for trading strategies."""
@@ -45,7 +51,7 @@ class StrategyBase(abc.ABC):
         self.status = strategy_config.status
         
         # Internal state
-        self.positions = {}  # Dict to track current positions
+        self.positions = {}  # Dict of (exchange, trading_pair) -> Position
         self.orders = {}     # Dict to track open orders
         self.signals = []    # List of generated signals
         
@@ -91,7 +97,7 @@ class StrategyBase(abc.ABC):
             trade: Completed trade
         """
         # Update internal trade tracking
-        logger.info(f"Trade completed: {trade.id} for {trade.trading_pair} on {trade.exchange}")
+        logger.info("Trade completed: %s for %s on %s", trade.id, trade.trading_pair, trade.exchange)
     
     async def _update_position(self, order: Order) -> None:
         """
@@ -100,10 +106,15 @@ class StrategyBase(abc.ABC):
         Args:
             order: Filled order
         """
-        position_key = f"{order.exchange}:{order.trading_pair}"
+        _LONG = PositionSide.LONG
+        _SHORT = PositionSide.SHORT
+        _now = datetime.now
+        
+        position_key = (order.exchange, order.trading_pair)
         
         # Determine position side
-        side = PositionSide.LONG if order.side == OrderSide.BUY else PositionSide.SHORT
+        is_buy = order.side == OrderSide.BUY
+        side = _LONG if is_buy else _SHORT
         
         # If position exists, update it
         if position_key in self.positions:
@@ -119,47 +130,48 @@ class StrategyBase(abc.ABC):
                 # Update position
                 position.entry_price = new_entry_price
                 position.quantity += order.filled_quantity
-                position.last_update_time = datetime.now()
+                position.last_update_time = _now()
             else:
                 # Opposite side, reduce position
                 if order.filled_quantity >= position.quantity:
                     # Position closed
                     realized_pnl = self._calculate_pnl(position, order)
-                    logger.info(f"Position closed: {position_key} with PnL: {realized_pnl}")
+                    logger.info("Position closed: %s:%s with PnL: %s", order.exchange, order.trading_pair, realized_pnl)
                     del self.positions[position_key]
                 else:
                     # Position reduced
                     realized_pnl = self._calculate_pnl(position, order)
                     position.quantity -= order.filled_quantity
                     position.realized_pnl += realized_pnl
-                    position.last_update_time = datetime.now()
-                    logger.info(f"Position reduced: {position_key} to {position.quantity} with PnL: {realized_pnl}")
+                    position.last_update_time = _now()
+                    logger.info("Position reduced: %s:%s to %s with PnL: %s",
+                                order.exchange, order.trading_pair, position.quantity, realized_pnl)
         else:
             # New position
-            if order.side == OrderSide.BUY:
+            if is_buy:
                 # Long position
                 position = Position(
                     exchange=order.exchange,
                     trading_pair=order.trading_pair,
-                    side=PositionSide.LONG,
+                    side=_LONG,
                     entry_price=order.average_fill_price,
                     quantity=order.filled_quantity,
                     strategy_id=self.id
                 )
                 self.positions[position_key] = position
-                logger.info(f"New long position: {position_key} at {position.entry_price}")
+                logger.info("New long position: %s:%s at %s", order.exchange, order.trading_pair, position.entry_price)
             else:
                 # Short position
                 position = Position(
                     exchange=order.exchange,
                     trading_pair=order.trading_pair,
-                    side=PositionSide.SHORT,
+                    side=_SHORT,
                     entry_price=order.average_fill_price,
                     quantity=order.filled_quantity,
                     strategy_id=self.id
                 )
                 self.positions[position_key] = position
-                logger.info(f"New short position: {position_key} at {position.entry_price}")
+                logger.info("New short position: %s:%s at %s", order.exchange, order.trading_pair, position.entry_price)
     
     def _calculate_pnl(self, position: Position, order: Order) -> float:
         """
@@ -212,24 +224,18 @@ class StrategyBase(abc.ABC):
             
         return position_size
     
-    def calculate_volatility(self, market_data_list: List[MarketData]) -> float:
+    def calculate_volatility(self, prices: np.ndarray) -> float:
         """
-        Calculate volatility from market data.
+        Calculate volatility from a series of close prices.
         
         Args:
-            market_data_list: List of market data points
+            prices: Close prices, oldest first
             
         Returns:
             Volatility measure
         """
-        if len(market_data_list) < 2:
-            return 0.0
-            
         # Calculate daily volatility using standard deviation of returns
-        prices = [data.close_price for data in market_data_list]
-        returns = [(prices[i] / prices[i-1]) - 1 for i in range(1, len(prices))]
-        
-        return statistics.stdev(returns) if returns else 0.0
+        return _volatility(np.ascontiguousarray(prices, dtype=np.float64))
 
 
 class MovingAverageCrossoverStrategy(StrategyBase):
@@ -247,7 +253,24 @@ class MovingAverageCrossoverStrategy(StrategyBase):
         # Internal state for MA calculations
         self.short_ma = {}  # Dict to store short MA for each pair
         self.long_ma = {}   # Dict to store long MA for each pair
+        self._diff = {}       # Dict of short MA - long MA for each pair
+        self._prev_diff = {}  # Dict of the same difference as of the previous bar
         self.market_data_history = {}  # Dict to store market data history
+        self._pair_meta: Dict[str, Tuple[str, str]] = {}  # pair_key -> (exchange, trading_pair)
+        
+        # Bars retained per pair in market_data_history
+        self._maxlen = max(self.short_window, self.long_window) + 10
+        
+        # Per-pair ring buffer of close prices; _head counts closes written so far
+        self._buffer_size = max(self.short_window, self.long_window) + 16
+        self._closes: Dict[str, np.ndarray] = {}
+        self._head: Dict[str, int] = {}
+        self._window_buf = np.empty(self._buffer_size, dtype=np.float64)  # Scratch for wrapped windows
+        self._bars_signaled: Dict[str, int] = {}  # Bar count each pair was last evaluated at
+        
+        # Running sums of the closes inside each window, updated per bar
+        self._short_sum = {}
+        self._long_sum = {}
     
     async def process_market_data(self, market_data: MarketData) -> None:
         """Process new market data for MA strategy."""
@@ -255,106 +278,163 @@ class MovingAverageCrossoverStrategy(StrategyBase):
         
         # Store market data
         if pair_key not in self.market_data_history:
-            self.market_data_history[pair_key] = []
+            self.market_data_history[pair_key] = deque(maxlen=self._maxlen)
+            self._pair_meta[pair_key] = (market_data.exchange, market_data.trading_pair)
+            self._closes[pair_key] = np.empty(self._buffer_size, dtype=np.float64)
+            self._head[pair_key] = 0
+            self._short_sum[pair_key] = 0.0
+            self._long_sum[pair_key] = 0.0
         
         self.market_data_history[pair_key].append(market_data)
         
-        # Keep only necessary data points
-        max_window = max(self.short_window, self.long_window)
-        if len(self.market_data_history[pair_key]) > max_window + 10:  # Keep a few extra for calculations
-            self.market_data_history[pair_key] = self.market_data_history[pair_key][-max_window-10:]
-        
-        # Update moving averages
-        if len(self.market_data_history[pair_key]) >= self.short_window:
-            short_data = self.market_data_history[pair_key][-self.short_window:]
-            self.short_ma[pair_key] = sum(data.close_price for data in short_data) / self.short_window
+        # Write the close into the ring buffer
+        closes = self._closes[pair_key]
+        size = self._buffer_size
+        close_price = market_data.close_price
+        closes[self._head[pair_key] % size] = close_price
+        count = self._head[pair_key] = self._head[pair_key] + 1
+        
+        short_window = self.short_window
+        long_window = self.long_window
+        
+        # Slide the window sums: add the new close, drop the close that left each window
+        if count % MA_RESYNC_INTERVAL:
+            short_sum = self._short_sum[pair_key] + close_price
+            if count > short_window:
+                short_sum -= closes[(count - short_window - 1) % size]
+            
+            long_sum = self._long_sum[pair_key] + close_price
+            if count > long_window:
+                long_sum -= closes[(count - long_window - 1) % size]
+        else:
+            # Periodically recompute from the ring to bound floating-point drift
+            short_sum, long_sum, _ = _ma_stats(self._window(pair_key, size), short_window, long_window)
+        self._short_sum[pair_key] = short_sum
+        self._long_sum[pair_key] = long_sum
+        
+        # Update moving averages, remembering the previous bar's values
+        short_ma = self.short_ma
+        long_ma = self.long_ma
+        if count >= short_window:
+            short_ma[pair_key] = short_sum / short_window
+        
+        if count >= long_window:
+            long_ma[pair_key] = long_sum / long_window
+        
+        # Track the MA difference; a crossover is a sign change between bars
+        if count >= short_window and count >= long_window:
+            diff = self._diff.get(pair_key)
+            if diff is not None:
+                self._prev_diff[pair_key] = diff
+            self._diff[pair_key] = short_ma[pair_key] - long_ma[pair_key]
+    
+    def _window(self, pair_key: str, w: int) -> np.ndarray:
+        """
+        Return the last ``w`` closes for a pair, oldest first.
         
-        if len(self.market_data_history[pair_key]) >= self.long_window:
-            long_data = self.market_data_history[pair_key][-self.long_window:]
-            self.long_ma[pair_key] = sum(data.close_price for data in long_data) / self.long_window
+        Args:
+            pair_key: Exchange/pair key
+            w: Number of closes wanted; clipped to what is buffered
+            
+        Returns:
+            Array of close prices; a view of the ring, or of a shared scratch
+            buffer when the window wraps (valid until the next call)
+        """
+        closes = self._closes[pair_key]
+        head = self._head[pair_key]
+        size = self._buffer_size
+        w = min(w, head, size)
+        
+        end = head % size
+        start = end - w
+        if start >= 0:
+            return closes[start:end]
+        
+        # Unwrap into the scratch buffer instead of allocating a new array
+        out = self._window_buf
+        split = -start
+        out[:split] = closes[start:]
+        out[split:w] = closes[:end]
+        return out[:w]
     
     async def generate_signals(self) -> List[Signal]:
         """Generate trading signals for MA strategy."""
         signals = []
         
+        _LONG = PositionSide.LONG
+        _SHORT = PositionSide.SHORT
+        
+        # One timestamp for every signal of this pass
+        now = datetime.now()
+        expiration = now + timedelta(hours=1)
+        
+        short_window = self.short_window
+        long_window = self.long_window
+        diffs = self._diff
+        prev_diffs = self._prev_diff
+        closes = self._closes
+        heads = self._head
+        size = self._buffer_size
+        positions = self.positions
+        pair_meta = self._pair_meta
+        
+        bars_signaled = self._bars_signaled
+        
         for pair_key in self.market_data_history:
-            if pair_key not in self.short_ma or pair_key not in self.long_ma:
+            # Skip pairs without a new bar since the last pass
+            bars_seen = heads[pair_key]
+            if bars_signaled.get(pair_key) == bars_seen:
                 continue
-                
-            exchange, trading_pair = pair_key.split(':')
+            bars_signaled[pair_key] = bars_seen
             
-            # Get previous moving averages (if available)
-            prev_short_ma = None
-            prev_long_ma = None
+            # Only generate signals if we have the previous bar's MAs
+            prev_diff = prev_diffs.get(pair_key)
+            if prev_diff is None:
+                continue
             
-            if len(self.market_data_history[pair_key]) > self.short_window:
-                prev_short_data = self.market_data_history[pair_key][-self.short_window-1:-1]
-                prev_short_ma = sum(data.close_price for data in prev_short_data) / self.short_window
+            # Crossover: short - long changed sign (moving off zero counts, landing on it does not)
+            curr_diff = diffs[pair_key]
+            if curr_diff == 0.0 or prev_diff * curr_diff > 0.0:
+                continue
             
-            if len(self.market_data_history[pair_key]) > self.long_window:
-                prev_long_data = self.market_data_history[pair_key][-self.long_window-1:-1]
-                prev_long_ma = sum(data.close_price for data in prev_long_data) / self.long_window
+            if curr_diff > 0.0:
+                # Bullish crossover (short MA crosses above long MA)
+                direction = _LONG
+                crossover_type = "bullish"
+            else:
+                # Bearish crossover (short MA crosses below long MA)
+                direction = _SHORT
+                crossover_type = "bearish"
             
-            # Current moving averages
-            current_short_ma = self.short_ma[pair_key]
-            current_long_ma = self.long_ma[pair_key]
+            exchange, trading_pair = pair_meta[pair_key]
+            position = positions.get((exchange, trading_pair))
+            if position is not None and position.side == direction:
+                continue
             
-            # Check for crossover
-            current_position = None
-            if pair_key in self.positions:
-                current_position = self.positions[pair_key].side
+            # Calculate position size; one fused pass also refreshes the running MA sums.
+            # Volatility covers the same _maxlen bars as market_data_history, not the whole ring
+            short_sum, long_sum, volatility = _ma_stats(self._window(pair_key, self._maxlen), short_window, long_window)
+            self._short_sum[pair_key] = short_sum
+            self._long_sum[pair_key] = long_sum
+            position_size = self.calculate_position_size(
+                trading_pair, exchange, 10000, volatility  # Assuming 10000 available capital
+            )
             
-            # Only generate signals if we have previous MAs
-            if prev_short_ma is not None and prev_long_ma is not None:
-                # Bullish crossover (short MA crosses above long MA)
-                if prev_short_ma <= prev_long_ma and current_short_ma > current_long_ma:
-                    if current_position != PositionSide.LONG:
-                        # Calculate position size
-                        volatility = self.calculate_volatility(self.market_data_history[pair_key])
-                        position_size = self.calculate_position_size(
-                            trading_pair, exchange, 10000, volatility  # Assuming 10000 available capital
-                        )
-                        
-                        signal = Signal(
-                            strategy_id=self.id,
-                            trading_pair=trading_pair,
-                            exchange=exchange,
-                            signal_type=SignalType.ENTRY,
-                            direction=PositionSide.LONG,
-                            strength=1.0,
-                            price=self.market_data_history[pair_key][-1].close_price,
-                            quantity=position_size,
-                            timestamp=datetime.now(),
-                            expiration=datetime.now() + timedelta(hours=1),
-                            metadata={"crossover_type": "bullish"}
-                        )
-                        signals.append(signal)
-                        logger.info(f"Generated bullish signal for {pair_key}")
-                
-                # Bearish crossover (short MA crosses below long MA)
-                elif prev_short_ma >= prev_long_ma and current_short_ma < current_long_ma:
-                    if current_position != PositionSide.SHORT:
-                        # Calculate position size
-                        volatility = self.calculate_volatility(self.market_data_history[pair_key])
-                        position_size = self.calculate_position_size(
-                            trading_pair, exchange, 10000, volatility  # Assuming 10000 available capital
-                        )
-                        
-                        signal = Signal(
-                            strategy_id=self.id,
-                            trading_pair=trading_pair,
-                            exchange=exchange,
-                            signal_type=SignalType.ENTRY,
-                            direction=PositionSide.SHORT,
-                            strength=1.0,
-                            price=self.market_data_history[pair_key][-1].close_price,
-                            quantity=position_size,
-                            timestamp=datetime.now(),
-                            expiration=datetime.now() + timedelta(hours=1),
-                            metadata={"crossover_type": "bearish"}
-                        )
-                        signals.append(signal)
-                        logger.info(f"Generated bearish signal for {pair_key}")
+            signal = Signal(
+                strategy_id=self.id,
+                trading_pair=trading_pair,
+                exchange=exchange,
+                signal_type=SignalType.ENTRY,
+                direction=direction,
+                strength=1.0,
+                price=float(closes[pair_key][(bars_seen - 1) % size]),
+                quantity=position_size,
+                timestamp=now,
+                expiration=expiration,
+                metadata={"crossover_type": crossover_type}
+            )
+            signals.append(signal)
+            logger.info("Generated %s signal for %s", crossover_type, pair_key)
         
         return signals
 
@@ -372,51 +452,61 @@ class ArbitrageStrategy(StrategyBase):
         self.execution_delay = self.parameters.get('execution_delay', 5)  # seconds
         
         # Internal state
-        self.market_prices = {}  # Dict to store current prices across exchanges
         self.fee_rates = {}      # Dict to store fee rates for exchanges
         
         # Initialize fee rates
         for exchange in self.target_exchanges:
             self.fee_rates[exchange] = 0.001  # Default 0.1% fee
+        
+        # Latest bid/ask per pair, one slot per target exchange (0 / inf when unknown)
+        self._exchanges = list(self.target_exchanges)
+        self._ex_index = {exchange: i for i, exchange in enumerate(self._exchanges)}
+        self._bids: Dict[str, np.ndarray] = {}
+        self._asks: Dict[str, np.ndarray] = {}
+        self._dirty = set()  # Pairs quoted since the last generate_signals call
     
     async def process_market_data(self, market_data: MarketData) -> None:
         """Process new market data for arbitrage strategy."""
-        key = f"{market_data.exchange}:{market_data.trading_pair}"
-        self.market_prices[key] = {
-            'bid': market_data.bid_price,
-            'ask': market_data.ask_price,
-            'timestamp': market_data.timestamp
-        }
+        index = self._ex_index.get(market_data.exchange)
+        if index is None:
+            return
+        
+        pair = market_data.trading_pair
+        bids = self._bids.get(pair)
+        if bids is None:
+            bids = self._bids[pair] = np.zeros(len(self._exchanges))
+            self._asks[pair] = np.full(len(self._exchanges), np.inf)
+        
+        bid = market_data.bid_price
+        ask = market_data.ask_price
+        bids[index] = bid if bid is not None else 0.0
+        self._asks[pair][index] = ask if ask is not None else np.inf
+        self._dirty.add(pair)
     
     async def generate_signals(self) -> List[Signal]:
         """Generate trading signals for arbitrage strategy."""
         signals = []
         
-        # Group prices by trading pair
-        pair_prices = {}
-        for key, price_data in self.market_prices.items():
-            exchange, pair = key.split(':')
-            if pair not in pair_prices:
-                pair_prices[pair] = {}
-            pair_prices[pair][exchange] = price_data
-        
-        # Look for arbitrage opportunities
-        for pair, exchanges in pair_prices.items():
-            if len(exchanges) < 2:
-                continue
+        _LONG = PositionSide.LONG
+        
+        # One timestamp for every signal of this pass
+        now = datetime.now()
+        expiration = now + timedelta(seconds=self.execution_delay)
+        
+        # Look for arbitrage opportunities; only pairs with new quotes can have changed
+        for pair in self._dirty:
+            bids = self._bids[pair]
+            asks = self._asks[pair]
             
             # Find best bid and ask across exchanges
-            best_bid = {'exchange': None, 'price': 0}
-            best_ask = {'exchange': None, 'price': float('inf')}
-            
-            for exchange, price_data in exchanges.items():
-                if price_data.get('bid', 0) > best_bid['price']:
-                    best_bid = {'exchange': exchange, 'price': price_data.get('bid', 0)}
-                if price_data.get('ask', float('inf')) < best_ask['price']:
-                    best_ask = {'exchange': exchange, 'price': price_data.get('ask', float('inf'))}
+            bid_index = int(np.argmax(bids))
+            ask_index = int(np.argmin(asks))
             
             # Calculate potential profit
-            if best_bid['exchange'] and best_ask['exchange'] and best_bid['exchange'] != best_ask['exchange']:
+            if bids[bid_index] > 0 and asks[ask_index] < np.inf and bid_index != ask_index:
+                best_bid = {'exchange': self._exchanges[bid_index], 'price': float(bids[bid_index])}
+                best_ask = {'exchange': self._exchanges[ask_index], 'price': float(asks[ask_index])}
+                
                 spread = best_bid['price'] - best_ask['price']
                 spread_percentage = spread / best_ask['price'] if best_ask['price'] > 0 else 0
                 
@@ -430,7 +520,8 @@ class ArbitrageStrategy(StrategyBase):
                 # Check if profitable after fees
                 if net_profit_percentage > self.min_profit_threshold:
                     # Calculate position size based on profit potential
-                    position_size = self.max_position_size * min(1.0, net_profit_percentage * 10)
+                    strength = min(1.0, net_profit_percentage * 10)  # Scale strength by profit
+                    position_size = self.max_position_size * strength
                     
                     # Generate buy signal
                     buy_signal = Signal(
@@ -438,12 +529,12 @@ class ArbitrageStrategy(StrategyBase):
                         trading_pair=pair,
                         exchange=best_ask['exchange'],
                         signal_type=SignalType.ENTRY,
-                        direction=PositionSide.LONG,
-                        strength=min(1.0, net_profit_percentage * 10),  # Scale strength by profit
+                        direction=_LONG,
+                        strength=strength,
                         price=best_ask['price'],
                         quantity=position_size * 10000,  # Assuming 10000 available capital
-                        timestamp=datetime.now(),
-                        expiration=datetime.now() + timedelta(seconds=self.execution_delay),
+                        timestamp=now,
+                        expiration=expiration,
                         metadata={
                             "arbitrage_type": "cross_exchange",
                             "sell_exchange": best_bid['exchange'],
@@ -459,12 +550,12 @@ class ArbitrageStrategy(StrategyBase):
                         trading_pair=pair,
                         exchange=best_bid['exchange'],
                         signal_type=SignalType.EXIT,
-                        direction=PositionSide.LONG,
-                        strength=min(1.0, net_profit_percentage * 10),  # Scale strength by profit
+                        direction=_LONG,
+                        strength=strength,
                         price=best_bid['price'],
                         quantity=position_size * 10000,  # Assuming 10000 available capital
-                        timestamp=datetime.now(),
-                        expiration=datetime.now() + timedelta(seconds=self.execution_delay),
+                        timestamp=now,
+                        expiration=expiration,
                         metadata={
                             "arbitrage_type": "cross_exchange",
                             "buy_exchange": best_ask['exchange'],
@@ -474,10 +565,12 @@ class ArbitrageStrategy(StrategyBase):
                     )
                     signals.append(sell_signal)
                     
-                    logger.info(f"Arbitrage opportunity: Buy {pair} on {best_ask['exchange']} at {best_ask['price']}, "
-                               f"Sell on {best_bid['exchange']} at {best_bid['price']}, "
-                               f"Profit: {net_profit_percentage:.2f}%")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Arbitrage opportunity: Buy %s on %s at %s, Sell on %s at %s, Profit: %.2f%%",
+                                    pair, best_ask['exchange'], best_ask['price'],
+                                    best_bid['exchange'], best_bid['price'], net_profit_percentage)
         
+        self._dirty.clear()
         return signals
 
 
@@ -516,6 +609,33 @@ class StrategyManager:
         """
         self.data_collector = data_collector
         self.strategies = {}  # Dict of strategy_id -> Strategy
+        # Dict of (exchange, trading_pair) -> bound process_market_data of active strategies targeting it
+        self._route = defaultdict(list)
+        
+        # Bumped whenever a strategy is added, removed or changes status
+        self.version = 0
+    
+    def _route_strategy(self, strategy: StrategyBase) -> None:
+        """Add an active strategy's market data handler to the routing index."""
+        if strategy.status != "ACTIVE":
+            return
+        
+        handler = strategy.process_market_data
+        for exchange in strategy.target_exchanges:
+            for trading_pair in strategy.target_pairs:
+                self._route[(exchange, trading_pair)].append(handler)
+    
+    def _unroute_strategy(self, strategy: StrategyBase) -> None:
+        """Remove a strategy's market data handler from the routing index."""
+        handler = strategy.process_market_data
+        for exchange in strategy.target_exchanges:
+            for trading_pair in strategy.target_pairs:
+                routed = self._route.get((exchange, trading_pair))
+                if routed is None or handler not in routed:
+                    continue
+                routed.remove(handler)
+                if not routed:
+                    del self._route[(exchange, trading_pair)]
     
     async def add_strategy(self, strategy_config: Strategy) -> None:
         """
@@ -525,7 +645,12 @@ class StrategyManager:
             strategy_config: Strategy configuration
         """
         strategy = StrategyFactory.create_strategy(strategy_config, self.data_collector)
+        if strategy_config.id in self.strategies:
+            # Replacing a strategy: drop the old instance from the routing index first
+            await self.remove_strategy(strategy_config.id)
         self.strategies[strategy_config.id] = strategy
+        self._route_strategy(strategy)
+        self.version += 1
         logger.info(f"Added strategy: {strategy_config.id} ({strategy_config.name})")
     
     async def remove_strategy(self, strategy_id: str) -> None:
@@ -536,9 +661,29 @@ class StrategyManager:
             strategy_id: Strategy ID
         """
         if strategy_id in self.strategies:
-            del self.strategies[strategy_id]
+            strategy = self.strategies.pop(strategy_id)
+            self._unroute_strategy(strategy)
+            self.version += 1
             logger.info(f"Removed strategy: {strategy_id}")
     
+    async def set_strategy_status(self, strategy_id: str, status: str) -> None:
+        """
+        Change a strategy's status and update market data routing to match.
+        
+        Args:
+            strategy_id: Strategy ID
+            status: New status (only "ACTIVE" strategies receive market data)
+        """
+        strategy = self.strategies.get(strategy_id)
+        if strategy is None:
+            return
+        
+        self._unroute_strategy(strategy)
+        strategy.status = status
+        self._route_strategy(strategy)
+        self.version += 1
+        logger.info(f"Strategy {strategy_id} status set to {status}")
+    
     async def process_market_data(self, market_data: MarketData) -> None:
         """
         Process market data through all active strategies.
@@ -546,9 +691,19 @@ class StrategyManager:
         Args:
             market_data: Market data
         """
-        for strategy in self.strategies.values():
-            if strategy.status == "ACTIVE" and market_data.exchange in strategy.target_exchanges and market_data.trading_pair in strategy.target_pairs:
-                await strategy.process_market_data(market_data)
+        handlers = self._route.get((market_data.exchange, market_data.trading_pair))
+        if not handlers:
+            return
+        
+        # Fan out so one slow strategy does not hold up the others
+        results = await asyncio.gather(
+            *(handler(market_data) for handler in handlers),
+            return_exceptions=True
+        )
+        
+        for handler, result in zip(handlers, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing market data in strategy {handler.__self__.id}: {result}")
     
     async def generate_signals(self) -> List[Signal]:
         """
@@ -557,11 +712,38 @@ class StrategyManager:
         Returns:
             List of signals
         """
+        strategies = [strategy for strategy in self.strategies.values() if strategy.status == "ACTIVE"]
+        return await self._gather_signals(strategies)
+    
+    async def generate_signals_for(self, exchange: str, trading_pair: str) -> List[Signal]:
+        """
+        Generate signals from the active strategies routed to one exchange/pair.
+        
+        Args:
+            exchange: Exchange name
+            trading_pair: Trading pair
+            
+        Returns:
+            List of signals
+        """
+        handlers = self._route.get((exchange, trading_pair))
+        if not handlers:
+            return []
+        return await self._gather_signals([handler.__self__ for handler in handlers])
+    
+    async def _gather_signals(self, strategies: List[StrategyBase]) -> List[Signal]:
+        """Run generate_signals on the given strategies concurrently and collect the results."""
+        results = await asyncio.gather(
+            *(strategy.generate_signals() for strategy in strategies),
+            return_exceptions=True
+        )
+        
         all_signals = []
-        for strategy in self.strategies.values():
-            if strategy.status == "ACTIVE":
-                signals = await strategy.generate_signals()
-                all_signals.extend(signals)
+        for strategy, signals in zip(strategies, results):
+            if isinstance(signals, Exception):
+                logger.error(f"Error generating signals in strategy {strategy.id}: {signals}")
+                continue
+            all_signals.extend(signals)
         return all_signals
     
     async def on_order_update(self, order: Order) -> None:
@@ -4,17 +4,32 @@ This module provides a web-based user interface for monitoring and controlling t
 """
 
 import asyncio
-import json
+import functools
+import gzip
+import hashlib
 import logging
 import os
-import threading
+import time
 import webbrowser
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import aiohttp
 from aiohttp import web
 
+from ..models.base_models import Alert, Order, OrderSide, OrderStatus, OrderType, Position, PositionSide
+from ..utils import fastjson
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,25 +37,299 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+STATIC_DIR = os.path.join(os.path.dirname(__file__), 'static')
+INDEX_MAX_AGE = 3600  # Seconds browsers may reuse the cached index page
+STATIC_CHUNK_SIZE = 1024 * 1024  # Read size for static files when sendfile is unavailable
+DEFAULT_LIMIT = 50  # Items returned by list endpoints when no limit is given
+MAX_LIMIT = 500  # Upper bound on the limit query parameter
+STREAM_THRESHOLD = 100  # Order history length above which /api/orders is streamed
+STREAM_BATCH_SIZE = 50  # Orders serialized per streamed chunk
+STATUS_CACHE_TTL = 0.5  # Seconds a built /api/status body is reused
+PUSH_INTERVAL = 1.0  # Seconds between checks for changed state to push to /ws subscribers
+
+# Accepted spellings of a true boolean query flag, cased variants included to skip .lower()
+_TRUTHY = frozenset({'true', 'True', 'TRUE', '1', 'yes', 'Yes', 'YES', 'on', 'On', 'ON'})
+
+
+# Request key set once a handler has started streaming its response
+_STREAM_PREPARED = 'stream_prepared'
+
+
+class RequestError(Exception):
+    """Raised by a handler when the client's request is malformed or fails validation."""
+
+
+def json_response(payload, status: int = 200) -> web.Response:
+    """
+    Build a JSON response, serialized with orjson when available.
+    
+    Args:
+        payload: JSON-serializable response payload
+        status: HTTP status code
+        
+    Returns:
+        aiohttp response
+    """
+    return web.Response(body=fastjson.dumps(payload), status=status, content_type='application/json')
+
+
+def json_endpoint(handler):
+    """
+    Decorate a request handler so it can return a plain dict.
+    
+    Dicts are serialized with json_response; prepared responses (cached bodies,
+    304s, streams) pass through. Errors are answered with a uniform
+    {'status': 'error', 'message': ...} body: HTTP 400 for a RequestError and
+    HTTP 500, after logging, for anything unexpected. Once a handler has started
+    streaming, errors are re-raised since a new response can no longer be sent.
+    
+    Args:
+        handler: Handler method taking (self, request)
+        
+    Returns:
+        Wrapped handler
+    """
+    @functools.wraps(handler)
+    async def wrapper(self, request):
+        try:
+            result = await handler(self, request)
+        except web.HTTPException:
+            raise
+        except RequestError as e:
+            return json_response({'status': 'error', 'message': str(e)}, status=400)
+        except Exception as e:
+            logger.error(f"Error in {handler.__name__}: {e}")
+            if request.get(_STREAM_PREPARED):
+                raise
+            return json_response({'status': 'error', 'message': str(e)}, status=500)
+        if isinstance(result, web.StreamResponse):
+            return result
+        return json_response(result)
+    
+    return wrapper
+
+
+async def _read_json(request) -> Dict:
+    """
+    Read a request's JSON object body.
+    
+    Args:
+        request: Incoming request
+        
+    Returns:
+        Decoded body
+        
+    Raises:
+        RequestError: If the body is not valid JSON or not a JSON object
+    """
+    try:
+        data = await request.json()
+    except ValueError:
+        raise RequestError('Invalid JSON body')
+    if not isinstance(data, dict):
+        raise RequestError('JSON body must be an object')
+    return data
+
+
+def _etag(body: bytes) -> str:
+    """
+    Compute a strong ETag for a response body.
+    
+    Args:
+        body: Response body
+        
+    Returns:
+        Quoted entity tag (xxh3 when xxhash is installed, otherwise 64-bit BLAKE2b)
+    """
+    if xxhash is not None:
+        digest = xxhash.xxh3_64_hexdigest(body)
+    else:
+        digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_response(request, body: bytes, etag: Optional[str] = None) -> web.Response:
+    """
+    Build a JSON response carrying an ETag, or a 304 if the client already has it.
+    
+    Args:
+        request: Incoming request (for If-None-Match)
+        body: Serialized JSON body
+        etag: Precomputed ETag; by default it is computed over the whole body
+        
+    Returns:
+        aiohttp response
+    """
+    if etag is None:
+        etag = _etag(body)
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+    if request.headers.get('If-None-Match') == etag:
+        return web.Response(status=304, headers=headers)
+    return web.Response(body=body, headers=headers, content_type='application/json')
+
+
+def _parse_limit(query, default: int = DEFAULT_LIMIT, cap: int = MAX_LIMIT) -> int:
+    """
+    Parse the ``limit`` query parameter, clamped to [1, cap].
+    
+    Args:
+        query: Request query mapping
+        default: Value used when the parameter is missing or not an integer
+        cap: Largest limit accepted
+        
+    Returns:
+        Number of items to return
+    """
+    try:
+        limit = int(query.get('limit', default))
+    except (TypeError, ValueError):
+        return default
+    return min(max(limit, 1), cap)
+
+
+def _alert_to_dict(alert: Alert) -> Dict:
+    """Convert an alert to its API representation."""
+    return {
+        'id': alert.id,
+        'type': alert.type,
+        'source': alert.source,
+        'message': alert.message,
+        'timestamp': alert.timestamp,
+        'is_read': alert.is_read,
+        'severity': alert.severity,
+        'duplicate_count': alert.duplicate_count
+    }
+
+
+def _position_to_dict(position: Position) -> Dict:
+    """Convert a position to its API representation."""
+    return {
+        'exchange': position.exchange,
+        'trading_pair': position.trading_pair,
+        'side': position.side,
+        'entry_price': position.entry_price,
+        'quantity': position.quantity,
+        'unrealized_pnl': position.unrealized_pnl,
+        'realized_pnl': position.realized_pnl,
+        'last_update_time': position.last_update_time,
+        'stop_loss_price': position.stop_loss
+    }
+
+
+def _order_to_dict(order: Order) -> Dict:
+    """Convert an order to its API representation."""
+    return {
+        'id': order.id,
+        'exchange': order.exchange,
+        'trading_pair': order.trading_pair,
+        'order_type': order.order_type,
+        'side': order.side,
+        'quantity': order.quantity,
+        'price': order.price,
+        'status': order.status,
+        'created_at': order.created_at,
+        'updated_at': order.updated_at
+    }
+
+
+if msgspec is not None:
+    class PositionOut(msgspec.Struct):
+        """Wire shape of a position, encoded by msgspec without an intermediate dict."""
+        exchange: str
+        trading_pair: str
+        side: PositionSide
+        entry_price: float
+        quantity: float
+        unrealized_pnl: float
+        realized_pnl: float
+        last_update_time: datetime
+        stop_loss_price: Optional[float]
+    
+    class OrderOut(msgspec.Struct):
+        """Wire shape of an order, encoded by msgspec without an intermediate dict."""
+        id: Optional[str]
+        exchange: str
+        trading_pair: str
+        order_type: OrderType
+        side: OrderSide
+        quantity: float
+        price: Optional[float]
+        status: OrderStatus
+        created_at: datetime
+        updated_at: datetime
+    
+    def _enc_hook(obj):
+        """Encode numpy scalars, which msgspec does not handle natively."""
+        item = getattr(obj, 'item', None)
+        if item is None:
+            raise NotImplementedError(f"Objects of type {type(obj).__name__} are not supported")
+        return item()
+    
+    def _position_row(position: Position) -> 'PositionOut':
+        """Convert a position to its wire struct."""
+        return PositionOut(
+            position.exchange, position.trading_pair, position.side, position.entry_price,
+            position.quantity, position.unrealized_pnl, position.realized_pnl,
+            position.last_update_time, position.stop_loss
+        )
+    
+    def _order_row(order: Order) -> 'OrderOut':
+        """Convert an order to its wire struct."""
+        return OrderOut(
+            order.id, order.exchange, order.trading_pair, order.order_type, order.side,
+            order.quantity, order.price, order.status, order.created_at, order.updated_at
+        )
+    
+    # Serializer for position/order payloads, used instead of fastjson when msgspec is installed
+    encode_rows = msgspec.json.Encoder(enc_hook=_enc_hook).encode
+else:
+    _position_row = _position_to_dict
+    _order_row = _order_to_dict
+    encode_rows = fastjson.dumps
+
 
 class WebInterface:
     """
     Web-based user interface for the trading bot.
     """
     
-    def __init__(self, host: str = '0.0.0.0', port: int = 8080):
+    def __init__(self, host: str = '0.0.0.0', port: int = 8080, reuse_port: bool = False,
+                 unix_socket: Optional[str] = None):
         """
         Initialize the web interface.
         
         Args:
             host: Host to bind to
             port: Port to bind to
+            reuse_port: Bind the TCP socket with SO_REUSEPORT so several processes can share the port
+            unix_socket: Optional UNIX socket path to also serve on (e.g. behind a local reverse proxy)
         """
         self.host = host
         self.port = port
+        self.reuse_port = reuse_port
+        self.unix_socket = unix_socket
         self.app = web.Application()
         self.setup_routes()
         
+        # Index page, read and gzip-compressed once
+        self._index_bytes, self._index_gz = self._load_index()
+        
+        # Serialized /api/strategies body and the strategy manager version it reflects
+        self._strategies_cache: Optional[bytes] = None
+        self._strategies_cache_version = -1
+        
+        # Endpoint key -> future for a response body currently being built
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
+        # (monotonic build time, body, ETag) of the last /api/status response
+        self._status_cache: Optional[Tuple[float, bytes, str]] = None
+        
+        # Connected dashboard WebSockets receiving pushed updates
+        self._subscribers = set()
+        self._publish_tasks = set()  # Strong references to publishes scheduled from sync code
+        self._push_task: Optional[asyncio.Task] = None
+        self._push_state: Dict[str, Tuple[bytes, bytes]] = {}  # Snapshot type -> (fingerprint, message)
+        
         # Data storage
         self.performance_data = {}
         self.alerts = []
@@ -56,6 +345,8 @@ class WebInterface:
         
         # Status
         self.is_running = False
+        self._runner: Optional[web.AppRunner] = None
+        self._browser_task: Optional[asyncio.Task] = None
     
     def setup_routes(self):
         """Set up web routes."""
@@ -69,295 +360,467 @@ class WebInterface:
         self.app.router.add_post('/api/strategy/toggle', self.handle_strategy_toggle)
         self.app.router.add_post('/api/order/cancel', self.handle_order_cancel)
         self.app.router.add_post('/api/reset_circuit_breaker', self.handle_reset_circuit_breaker)
+        self.app.router.add_get('/ws', self.handle_ws)
+        
+        # Serve static files; aiohttp's FileResponse hands them to loop.sendfile() on
+        # plain (non-TLS) transports, so keep TLS in a reverse proxy in front of the bot
+        if os.path.isdir(STATIC_DIR):
+            self.app.router.add_static('/static/', path=STATIC_DIR, chunk_size=STATIC_CHUNK_SIZE)
+        else:
+            logger.warning(f"Static directory not found, /static/ disabled: {STATIC_DIR}")
+    
+    @staticmethod
+    def _load_index():
+        """
+        Read the index page and precompress it.
         
-        # Serve static files
-        self.app.router.add_static('/static/', path=os.path.join(os.path.dirname(__file__), 'static'))
+        Returns:
+            Tuple of (raw bytes, gzip bytes), or (None, None) if the page is missing
+        """
+        try:
+            with open(os.path.join(STATIC_DIR, 'index.html'), 'rb') as f:
+                content = f.read()
+        except OSError as e:
+            logger.warning(f"Index page not available: {e}")
+            return None, None
+        return content, gzip.compress(content, 6)
     
     async def handle_index(self, request):
         """Handle index page request."""
-        with open(os.path.join(os.path.dirname(__file__), 'static', 'index.html'), 'r') as f:
-            content = f.read()
-        return web.Response(text=content, content_type='text/html')
+        if self._index_bytes is None:
+            raise web.HTTPNotFound()
+        
+        headers = {
+            'Cache-Control': f'max-age={INDEX_MAX_AGE}',
+            'Vary': 'Accept-Encoding'
+        }
+        if 'gzip' in request.headers.get('Accept-Encoding', ''):
+            headers['Content-Encoding'] = 'gzip'
+            body = self._index_gz
+        else:
+            body = self._index_bytes
+        return web.Response(body=body, headers=headers, content_type='text/html', charset='utf-8')
     
+    async def _coalesced(self, key: str, build):
+        """
+        Build a JSON response body once for all concurrent requests to an endpoint.
+        
+        Args:
+            key: Endpoint key
+            build: Coroutine function returning the response body (or a tuple carrying it)
+            
+        Returns:
+            Shared build result
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            try:
+                future.set_result(await build())
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                del self._inflight[key]
+        
+        # Shield so a caller disconnecting does not cancel the body for the others
+        return await asyncio.shield(future)
+    
+    @json_endpoint
     async def handle_status(self, request):
         """Handle status API request."""
         if not self.monitoring_system or not self.risk_manager:
-            return web.json_response({
+            return {
                 'status': 'not_initialized',
                 'message': 'Bot components not initialized'
-            })
+            }
+        
+        # Dashboards poll this every second or two; serve a recent body as-is
+        cached = self._status_cache
+        if cached is None or time.monotonic() - cached[0] >= STATUS_CACHE_TTL:
+            cached = await self._coalesced('status', self._build_status)
+        
+        return etag_response(request, cached[1], cached[2])
+    
+    async def _build_status(self) -> Tuple[float, bytes, str]:
+        """
+        Build the /api/status response body and its ETag.
+        
+        The ETag covers everything but current_time, so an idle dashboard keeps
+        getting 304s while the state it shows is unchanged.
         
+        Returns:
+            Tuple of (monotonic build time, body, ETag)
+        """
         # Get risk metrics
         risk_metrics = self.risk_manager.get_risk_metrics() if self.risk_manager else {}
         
         # Get performance metrics
         performance_metrics = self.monitoring_system.get_performance_summary() if self.monitoring_system else {}
         
-        return web.json_response({
+        stable = fastjson.dumps({
             'status': 'running' if self.is_running else 'stopped',
             'mode': 'paper',  # TODO: Get from config
-            'current_time': datetime.now().isoformat(),
             'risk_metrics': risk_metrics,
             'performance_metrics': performance_metrics
         })
+        
+        # Splice the timestamp in front of the hashed fields instead of serializing twice
+        body = b'{"current_time":' + fastjson.dumps(datetime.now()) + b',' + stable[1:]
+        self._status_cache = (time.monotonic(), body, _etag(stable))
+        return self._status_cache
     
+    @json_endpoint
     async def handle_performance(self, request):
         """Handle performance API request."""
         if not self.monitoring_system:
-            return web.json_response({
+            return {
                 'status': 'error',
                 'message': 'Monitoring system not initialized'
-            })
+            }
         
+        body = await self._coalesced('performance', self._build_performance)
+        return web.Response(body=body, content_type='application/json')
+    
+    async def _build_performance(self) -> bytes:
+        """Build the /api/performance response body."""
         # Get performance metrics
         performance_metrics = self.monitoring_system.get_performance_summary()
         
         # Get daily performance
         daily_performance = self.monitoring_system.performance_monitor.get_daily_performance()
         
-        return web.json_response({
+        return fastjson.dumps({
             'status': 'success',
             'performance_metrics': performance_metrics,
             'daily_performance': daily_performance
         })
     
+    @json_endpoint
     async def handle_alerts(self, request):
         """Handle alerts API request."""
         if not self.monitoring_system:
-            return web.json_response({
+            return {
                 'status': 'error',
                 'message': 'Monitoring system not initialized'
-            })
+            }
         
         # Get alerts
-        include_read = request.query.get('include_read', 'false').lower() == 'true'
-        limit = int(request.query.get('limit', '50'))
+        include_read = request.query.get('include_read', '') in _TRUTHY
+        limit = _parse_limit(request.query)
         
         alerts = self.monitoring_system.get_alerts(limit, include_read)
         
         # Convert to JSON-serializable format
-        alerts_json = []
-        for alert in alerts:
-            alerts_json.append({
-                'id': alert.id,
-                'type': alert.type.value,
-                'source': alert.source,
-                'message': alert.message,
-                'timestamp': alert.timestamp.isoformat(),
-                'is_read': alert.is_read,
-                'severity': alert.severity
-            })
+        alerts_json = [_alert_to_dict(alert) for alert in alerts]
         
-        return web.json_response({
+        return {
             'status': 'success',
             'alerts': alerts_json,
             'unread_count': self.monitoring_system.alert_manager.get_unread_count()
-        })
+        }
     
+    @json_endpoint
     async def handle_positions(self, request):
         """Handle positions API request."""
         if not self.order_executor:
-            return web.json_response({
+            return {
                 'status': 'error',
                 'message': 'Order executor not initialized'
-            })
+            }
         
+        return web.Response(body=self._build_positions(), content_type='application/json')
+    
+    def _build_positions(self) -> bytes:
+        """Build the /api/positions response body."""
         # Get positions
         positions = self.order_executor.get_positions()
         
-        # Convert to JSON-serializable format
-        positions_json = []
-        for position in positions:
-            positions_json.append({
-                'exchange': position.exchange,
-                'trading_pair': position.trading_pair,
-                'side': position.side.value,
-                'entry_price': position.entry_price,
-                'quantity': position.quantity,
-                'unrealized_pnl': position.unrealized_pnl,
-                'realized_pnl': position.realized_pnl,
-                'last_update_time': position.last_update_time.isoformat() if position.last_update_time else None,
-                'stop_loss_price': position.stop_loss_price
-            })
-        
-        return web.json_response({
+        # Convert to wire rows (msgspec structs or dicts) and encode in one pass
+        return encode_rows({
             'status': 'success',
-            'positions': positions_json
+            'positions': [_position_row(position) for position in positions]
         })
     
+    @json_endpoint
     async def handle_orders(self, request):
         """Handle orders API request."""
         if not self.order_executor:
-            return web.json_response({
+            return {
                 'status': 'error',
                 'message': 'Order executor not initialized'
-            })
-        
-        # Get open orders
-        open_orders = self.order_executor.get_open_orders()
+            }
         
         # Get order history
-        limit = int(request.query.get('limit', '50'))
+        limit = _parse_limit(request.query)
         order_history = self.order_executor.get_order_history(limit)
         
-        # Convert to JSON-serializable format
-        open_orders_json = []
-        for order in open_orders:
-            open_orders_json.append({
-                'id': order.id,
-                'exchange': order.exchange,
-                'trading_pair': order.trading_pair,
-                'order_type': order.order_type.value,
-                'side': order.side.value,
-                'quantity': order.quantity,
-                'price': order.price,
-                'status': order.status.value,
-                'created_at': order.created_at.isoformat(),
-                'updated_at': order.updated_at.isoformat() if order.updated_at else None
-            })
+        if len(order_history) > STREAM_THRESHOLD:
+            # Convert to wire rows (msgspec structs or dicts)
+            open_orders_rows = [_order_row(order) for order in self.order_executor.get_open_orders()]
+            return await self._stream_orders(request, open_orders_rows, order_history)
         
-        order_history_json = []
-        for order in order_history:
-            order_history_json.append({
-                'id': order.id,
-                'exchange': order.exchange,
-                'trading_pair': order.trading_pair,
-                'order_type': order.order_type.value,
-                'side': order.side.value,
-                'quantity': order.quantity,
-                'price': order.price,
-                'status': order.status.value,
-                'created_at': order.created_at.isoformat(),
-                'updated_at': order.updated_at.isoformat() if order.updated_at else None
-            })
+        return web.Response(body=self._build_orders(order_history), content_type='application/json')
+    
+    def _build_orders(self, order_history: List[Order]) -> bytes:
+        """
+        Build the buffered /api/orders response body.
         
-        return web.json_response({
+        Args:
+            order_history: Historical orders to include
+            
+        Returns:
+            Response body
+        """
+        # Get open orders
+        open_orders = self.order_executor.get_open_orders()
+        
+        # Convert to wire rows (msgspec structs or dicts) and encode in one pass
+        return encode_rows({
             'status': 'success',
-            'open_orders': open_orders_json,
-            'order_history': order_history_json
+            'open_orders': [_order_row(order) for order in open_orders],
+            'order_history': [_order_row(order) for order in order_history]
         })
     
+    async def _stream_orders(self, request, open_orders_rows: List,
+                             order_history: List[Order]) -> web.StreamResponse:
+        """
+        Stream the orders payload, writing the history in batches.
+        
+        Produces the same document as the buffered response without holding
+        the whole serialized history in memory at once.
+        
+        Args:
+            request: Incoming request
+            open_orders_rows: Open orders, already converted
+            order_history: Historical orders to stream
+            
+        Returns:
+            Prepared and completed stream response
+        """
+        response = web.StreamResponse(headers={'Content-Type': 'application/json'})
+        await response.prepare(request)
+        request[_STREAM_PREPARED] = True
+        
+        await response.write(b'{"status":"success","open_orders":' + encode_rows(open_orders_rows) +
+                             b',"order_history":[')
+        for start in range(0, len(order_history), STREAM_BATCH_SIZE):
+            chunk = b','.join(
+                encode_rows(_order_row(order))
+                for order in order_history[start:start + STREAM_BATCH_SIZE]
+            )
+            await response.write(chunk if start == 0 else b',' + chunk)
+        await response.write(b']}')
+        
+        await response.write_eof()
+        return response
+    
+    @json_endpoint
     async def handle_strategies(self, request):
         """Handle strategies API request."""
         if not self.strategy_manager:
-            return web.json_response({
+            return {
                 'status': 'error',
                 'message': 'Strategy manager not initialized'
+            }
+        
+        # Strategies rarely change between dashboard polls; reuse the last body until they do
+        if self._strategies_cache is None or self._strategies_cache_version != self.strategy_manager.version:
+            strategies_json = []
+            for strategy_id, strategy in self.strategy_manager.strategies.items():
+                strategies_json.append({
+                    'id': strategy.id,
+                    'name': strategy.name,
+                    'type': strategy.type,
+                    'status': strategy.status,
+                    'target_exchanges': strategy.target_exchanges,
+                    'target_pairs': strategy.target_pairs,
+                    'parameters': strategy.parameters,
+                    'risk_parameters': strategy.risk_parameters
+                })
+            
+            self._strategies_cache = fastjson.dumps({
+                'status': 'success',
+                'strategies': strategies_json
             })
+            self._strategies_cache_version = self.strategy_manager.version
         
-        # Get strategies
-        strategies_json = []
-        for strategy_id, strategy in self.strategy_manager.strategies.items():
-            strategies_json.append({
-                'id': strategy.id,
-                'name': strategy.name,
-                'type': strategy.type.value,
-                'status': strategy.status,
-                'target_exchanges': strategy.target_exchanges,
-                'target_pairs': strategy.target_pairs,
-                'parameters': strategy.parameters,
-                'risk_parameters': strategy.risk_parameters
-            })
-        
-        return web.json_response({
-            'status': 'success',
-            'strategies': strategies_json
-        })
+        return etag_response(request, self._strategies_cache)
     
+    @json_endpoint
     async def handle_strategy_toggle(self, request):
         """Handle strategy toggle API request."""
         if not self.strategy_manager:
-            return web.json_response({
+            return {
                 'status': 'error',
                 'message': 'Strategy manager not initialized'
-            })
+            }
         
-        try:
-            data = await request.json()
-            strategy_id = data.get('strategy_id')
-            
-            if not strategy_id or strategy_id not in self.strategy_manager.strategies:
-                return web.json_response({
-                    'status': 'error',
-                    'message': 'Invalid strategy ID'
-                })
-            
-            strategy = self.strategy_manager.strategies[strategy_id]
-            
-            # Toggle strategy status
-            if strategy.status == 'ACTIVE':
-                strategy.status = 'INACTIVE'
-            else:
-                strategy.status = 'ACTIVE'
-            
-            return web.json_response({
-                'status': 'success',
-                'strategy_id': strategy_id,
-                'new_status': strategy.status
-            })
-        except Exception as e:
-            logger.error(f"Error toggling strategy: {e}")
-            return web.json_response({
-                'status': 'error',
-                'message': str(e)
-            })
+        data = await _read_json(request)
+        strategy_id = data.get('strategy_id')
+        
+        if not strategy_id or strategy_id not in self.strategy_manager.strategies:
+            raise RequestError('Invalid strategy ID')
+        
+        strategy = self.strategy_manager.strategies[strategy_id]
+        
+        # Toggle strategy status through the manager so market data routing follows it
+        new_status = 'INACTIVE' if strategy.status == 'ACTIVE' else 'ACTIVE'
+        await self.strategy_manager.set_strategy_status(strategy_id, new_status)
+        self._strategies_cache = None
+        await self.publish({'type': 'strategy', 'strategy_id': strategy_id, 'status': strategy.status})
+        
+        return {
+            'status': 'success',
+            'strategy_id': strategy_id,
+            'new_status': strategy.status
+        }
     
+    @json_endpoint
     async def handle_order_cancel(self, request):
         """Handle order cancel API request."""
         if not self.order_executor:
-            return web.json_response({
+            return {
                 'status': 'error',
                 'message': 'Order executor not initialized'
-            })
-        
-        try:
-            data = await request.json()
-            order_id = data.get('order_id')
-            exchange = data.get('exchange')
-            trading_pair = data.get('trading_pair')
-            
-            if not order_id or not exchange or not trading_pair:
-                return web.json_response({
-                    'status': 'error',
-                    'message': 'Missing required parameters'
-                })
-            
-            # Cancel order
-            result = await self.order_executor.cancel_order(order_id, exchange, trading_pair)
-            
-            return web.json_response({
-                'status': 'success' if result else 'error',
-                'message': 'Order canceled' if result else 'Failed to cancel order'
-            })
-        except Exception as e:
-            logger.error(f"Error canceling order: {e}")
-            return web.json_response({
-                'status': 'error',
-                'message': str(e)
-            })
+            }
+        
+        data = await _read_json(request)
+        order_id = data.get('order_id')
+        exchange = data.get('exchange')
+        trading_pair = data.get('trading_pair')
+        
+        if not order_id or not exchange or not trading_pair:
+            raise RequestError('Missing required parameters')
+        
+        # Cancel order
+        result = await self.order_executor.cancel_order(order_id, exchange, trading_pair)
+        if result:
+            await self.publish({'type': 'order_canceled', 'order_id': order_id,
+                                'exchange': exchange, 'trading_pair': trading_pair})
+        
+        return {
+            'status': 'success' if result else 'error',
+            'message': 'Order canceled' if result else 'Failed to cancel order'
+        }
     
+    @json_endpoint
     async def handle_reset_circuit_breaker(self, request):
         """Handle reset circuit breaker API request."""
         if not self.risk_manager:
-            return web.json_response({
+            return {
                 'status': 'error',
                 'message': 'Risk manager not initialized'
-            })
+            }
+        
+        # Reset circuit breaker
+        self.risk_manager.reset_circuit_breaker()
+        
+        return {
+            'status': 'success',
+            'message': 'Circuit breaker reset'
+        }
+    
+    async def handle_ws(self, request):
+        """Handle a dashboard WebSocket subscribing to pushed state updates."""
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
         
+        self._subscribers.add(ws)
         try:
-            # Reset circuit breaker
-            self.risk_manager.reset_circuit_breaker()
+            await ws.send_str(fastjson.dumps({
+                'type': 'status',
+                'status': 'running' if self.is_running else 'stopped'
+            }).decode('utf-8'))
             
-            return web.json_response({
-                'status': 'success',
-                'message': 'Circuit breaker reset'
-            })
-        except Exception as e:
-            logger.error(f"Error resetting circuit breaker: {e}")
-            return web.json_response({
-                'status': 'error',
-                'message': str(e)
-            })
+            # Bring the new subscriber up to date, then let the push loop send changes
+            for _, message in list(self._push_state.values()):
+                await ws.send_str(message.decode('utf-8'))
+            if self._push_task is None or self._push_task.done():
+                self._push_task = asyncio.get_running_loop().create_task(self._push_loop())
+            
+            # Updates are push-only; drain client frames until it disconnects
+            async for _ in ws:
+                pass
+        finally:
+            self._subscribers.discard(ws)
+        return ws
+    
+    async def _snapshots(self):
+        """
+        Build the state snapshots the REST endpoints serve, for pushing.
+        
+        Returns:
+            List of (type, fingerprint, body) for each initialized component
+        """
+        snapshots = []
+        if self.monitoring_system and self.risk_manager:
+            cached = self._status_cache
+            if cached is None or time.monotonic() - cached[0] >= STATUS_CACHE_TTL:
+                cached = await self._coalesced('status', self._build_status)
+            snapshots.append(('status', cached[2].encode(), cached[1]))
+        if self.monitoring_system:
+            body = await self._coalesced('performance', self._build_performance)
+            snapshots.append(('performance', body, body))
+        if self.order_executor:
+            body = self._build_positions()
+            snapshots.append(('positions', body, body))
+            body = self._build_orders(self.order_executor.get_order_history(DEFAULT_LIMIT))
+            snapshots.append(('orders', body, body))
+        return snapshots
+    
+    async def _push_loop(self) -> None:
+        """Push status, performance, positions and orders to subscribers whenever they change."""
+        while self._subscribers:
+            try:
+                for snapshot_type, fingerprint, body in await self._snapshots():
+                    previous = self._push_state.get(snapshot_type)
+                    if previous is not None and previous[0] == fingerprint:
+                        continue
+                    message = b'{"type":"' + snapshot_type.encode() + b'","data":' + body + b'}'
+                    self._push_state[snapshot_type] = (fingerprint, message)
+                    await self._broadcast(message)
+            except Exception as e:
+                logger.error(f"Error pushing dashboard state: {e}")
+            await asyncio.sleep(PUSH_INTERVAL)
+        
+        # Nobody is listening; start from a clean slate for the next subscriber
+        self._push_state.clear()
+    
+    async def publish(self, message: Dict) -> None:
+        """
+        Push a state update to every connected dashboard.
+        
+        The message is serialized once and the sends run concurrently;
+        subscribers whose send fails are dropped.
+        
+        Args:
+            message: JSON-serializable update with a 'type' key
+        """
+        if not self._subscribers:
+            return
+        
+        await self._broadcast(fastjson.dumps(message))
+    
+    async def _broadcast(self, message: bytes) -> None:
+        """
+        Send a serialized JSON message to every subscriber concurrently.
+        
+        Args:
+            message: UTF-8 JSON message
+        """
+        data = message.decode('utf-8')
+        subscribers = list(self._subscribers)
+        results = await asyncio.gather(
+            *(ws.send_str(data) for ws in subscribers),
+            return_exceptions=True
+        )
+        for ws, result in zip(subscribers, results):
+            if isinstance(result, Exception):
+                self._subscribers.discard(ws)
     
     def set_components(self, monitoring_system=None, risk_manager=None, 
                       strategy_manager=None, order_executor=None):
@@ -383,35 +846,84 @@ class WebInterface:
             is_running: Whether the bot is running
         """
         self.is_running = is_running
+        self._status_cache = None
+        
+        if self._subscribers:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            task = loop.create_task(self.publish({'type': 'status', 'status': 'running' if is_running else 'stopped'}))
+            self._publish_tasks.add(task)
+            task.add_done_callback(self._publish_tasks.discard)
     
-    async def start(self):
-        """Start the web interface."""
-        runner = web.AppRunner(self.app)
-        await runner.setup()
-        site = web.TCPSite(runner, self.host, self.port)
+    async def start(self, open_browser: bool = True):
+        """
+        Start the web interface on the running event loop.
+        
+        Args:
+            open_browser: Whether to open the dashboard in a browser once serving
+        """
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port, reuse_port=self.reuse_port)
         await site.start()
         
         logger.info(f"Web interface started at http://{self.host}:{self.port}")
         
-        # Open browser
-        webbrowser.open(f"http://localhost:{self.port}")
+        if self.unix_socket:
+            await web.UnixSite(self._runner, self.unix_socket).start()
+            logger.info(f"Web interface listening on unix:{self.unix_socket}")
+        if os.environ.get('AIOHTTP_NOSENDFILE'):
+            logger.warning("AIOHTTP_NOSENDFILE is set; static files are copied through user space")
+        
+        if open_browser:
+            # Deferred so start() returns immediately
+            self._browser_task = asyncio.get_running_loop().create_task(
+                self._open_browser(f"http://localhost:{self.port}")
+            )
     
-    @staticmethod
-    def run_in_thread(web_interface):
+    async def _open_browser(self, url: str) -> None:
         """
-        Run the web interface in a separate thread.
+        Open the dashboard in a browser shortly after the server starts.
         
         Args:
-            web_interface: WebInterface instance
+            url: Dashboard URL
         """
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(web_interface.start())
-        loop.run_forever()
-    
-    def start_in_thread(self):
-        """Start the web interface in a separate thread."""
-        thread = threading.Thread(target=self.run_in_thread, args=(self,))
-        thread.daemon = True
-        thread.start()
-        return thread
+        await asyncio.sleep(0.5)
+        
+        # webbrowser.open can block, so run it off the loop
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, webbrowser.open, url)
+        except Exception as e:
+            logger.warning(f"Could not open browser: {e}")
+    
+    async def stop(self):
+        """Stop serving and release the listening socket."""
+        for ws in list(self._subscribers):
+            await ws.close()
+        if self._push_task is not None:
+            self._push_task.cancel()
+            self._push_task = None
+        if self._browser_task is not None:
+            self._browser_task.cancel()
+            self._browser_task = None
+        
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            logger.info("Web interface stopped")
+    
+    def run(self):
+        """Run the web interface standalone, blocking until interrupted."""
+        async def serve():
+            await self.start()
+            try:
+                await asyncio.Event().wait()
+            finally:
+                await self.stop()
+        
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            pass
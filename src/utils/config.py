@@ -2,9 +2,12 @@
 Configuration file for the cryptocurrency trading bot.
 """
 
-import json
+import copy
 import os
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Dict, Any, List, Tuple
+
+from . import fastjson
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -83,6 +86,95 @@ DEFAULT_CONFIG = {
 }
 
 
+@dataclass(frozen=True)
+class ExchangeConfig:
+    """Parsed configuration for a single exchange."""
+    __slots__ = ('name', 'api_key', 'api_secret', 'websocket_url', 'trading_pairs')
+    
+    name: str
+    api_key: str
+    api_secret: str
+    websocket_url: str
+    trading_pairs: Tuple[str, ...]
+    
+    @classmethod
+    def from_dict(cls, name: str, config: Dict[str, Any]) -> 'ExchangeConfig':
+        """
+        Build exchange configuration from its config section.
+        
+        Args:
+            name: Exchange name
+            config: Exchange configuration dictionary
+            
+        Returns:
+            ExchangeConfig instance
+        """
+        return cls(
+            name=name,
+            api_key=config.get('api_key', ''),
+            api_secret=config.get('api_secret', ''),
+            websocket_url=config.get('websocket_url', ''),
+            trading_pairs=tuple(config.get('trading_pairs', []))
+        )
+
+
+@dataclass(frozen=True)
+class BotConfig:
+    """
+    Parsed top-level bot configuration.
+    
+    Component sections (risk management, monitoring, strategies) are kept as
+    dictionaries since the components are configured from dictionaries.
+    """
+    __slots__ = ('mode', 'initial_capital', 'exchanges', 'strategies', 'risk_management', 'monitoring')
+    
+    mode: str
+    initial_capital: float
+    exchanges: Dict[str, ExchangeConfig]
+    strategies: List[Dict[str, Any]]
+    risk_management: Dict[str, Any]
+    monitoring: Dict[str, Any]
+    
+    @property
+    def paper_mode(self) -> bool:
+        """Whether the bot trades on the paper trading system."""
+        return self.mode == 'paper'
+    
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> 'BotConfig':
+        """
+        Build bot configuration from a configuration dictionary.
+        
+        Args:
+            config: Configuration dictionary
+            
+        Returns:
+            BotConfig instance
+        """
+        return cls(
+            mode=config.get('mode', 'paper'),
+            initial_capital=float(config.get('initial_capital', 10000.0)),
+            exchanges={
+                name: ExchangeConfig.from_dict(name, exchange_config)
+                for name, exchange_config in config.get('exchanges', {}).items()
+            },
+            strategies=config.get('strategies', []),
+            risk_management=config.get('risk_management', {}),
+            monitoring=config.get('monitoring', {})
+        )
+
+
+_default_config_bytes = None  # DEFAULT_CONFIG serialized once, on first use
+
+
+def _default_config_json() -> bytes:
+    """Return DEFAULT_CONFIG as indented JSON bytes, serializing it only once."""
+    global _default_config_bytes
+    if _default_config_bytes is None:
+        _default_config_bytes = fastjson.dumps(DEFAULT_CONFIG, indent=True)
+    return _default_config_bytes
+
+
 def load_config(config_path: str) -> Dict[str, Any]:
     """
     Load configuration from file or create default if not exists.
@@ -91,22 +183,22 @@ def load_config(config_path: str) -> Dict[str, Any]:
         config_path: Path to configuration file
         
     Returns:
-        Configuration dictionary
+        Configuration dictionary (never the shared DEFAULT_CONFIG object itself)
     """
     if os.path.exists(config_path):
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            with open(config_path, 'rb') as f:
+                config = fastjson.loads(f.read())
             return config
         except Exception as e:
             print(f"Error loading configuration: {e}")
             print("Using default configuration")
-            return DEFAULT_CONFIG
+            return copy.deepcopy(DEFAULT_CONFIG)
     else:
         # Create default configuration file
-        with open(config_path, 'w') as f:
-            json.dump(DEFAULT_CONFIG, f, indent=2)
-        return DEFAULT_CONFIG
+        with open(config_path, 'wb') as f:
+            f.write(_default_config_json())
+        return copy.deepcopy(DEFAULT_CONFIG)
 
 
 def save_config(config: Dict[str, Any], config_path: str) -> None:
@@ -117,5 +209,5 @@ def save_config(config: Dict[str, Any], config_path: str) -> None:
         config: Configuration dictionary
         config_path: Path to configuration file
     """
-    with open(config_path, 'w') as f:
-        json.dump(config, f, indent=2)
+    with open(config_path, 'wb') as f:
+        f.write(fastjson.dumps(config, indent=True))
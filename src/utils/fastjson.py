@@ -0,0 +1,74 @@
+"""
+JSON encoding and decoding helpers for the cryptocurrency trading bot.
+orjson is an optional dependency; without it the standard library json module is used.
+"""
+
+import json
+from datetime import date, datetime
+from enum import Enum
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj):
+    """
+    Encode types the standard library json module does not handle (orjson does so natively).
+    
+    Args:
+        obj: Object json could not serialize
+        
+    Returns:
+        JSON-serializable replacement
+        
+    Raises:
+        TypeError: If the object type is not supported
+    """
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data):
+    """
+    Deserialize JSON from str or bytes.
+    
+    Args:
+        data: JSON document as str or bytes
+        
+    Returns:
+        Deserialized Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, default=None, indent: bool = False) -> bytes:
+    """
+    Serialize an object to compact JSON bytes.
+    
+    datetime and date values are written as ISO 8601 strings and Enum members as their values.
+    
+    Args:
+        obj: Object to serialize
+        default: Optional callable for objects the encoder cannot handle natively
+        indent: Pretty-print with two-space indentation
+        
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    if indent:
+        return json.dumps(obj, default=default or _default, indent=2).encode('utf-8')
+    return json.dumps(obj, default=default or _default, separators=(',', ':')).encode('utf-8')
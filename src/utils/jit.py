@@ -0,0 +1,24 @@
+"""
+JIT compilation helpers for the cryptocurrency trading bot.
+Numba is an optional dependency; without it the decorators below leave functions as plain Python.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """
+        Fallback for numba.njit when numba is not installed.
+        
+        Supports both the bare ``@njit`` and the ``@njit(...)`` call forms.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        
+        def decorator(func):
+            return func
+        
+        return decorator
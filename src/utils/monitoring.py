@@ -4,30 +4,227 @@ This module provides monitoring, alerting, and notification capabilities.
 """
 
 import asyncio
+import bisect
+import heapq
+import html
 import logging
+import os
+import queue
 import smtplib
 import time
-from datetime import datetime, timedelta
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from typing import Dict, List, Optional, Union
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from email.message import EmailMessage
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, islice
 
-from src.models.base_models import Alert, AlertType, Order, Position
+import aiohttp
+import numpy as np
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from src.models.base_models import Alert, AlertType, Order, OrderStatus, Position, PositionSide
+from src.utils import fastjson
+
+# Logging is configured by the entry point
 logger = logging.getLogger(__name__)
 
+MAX_ALERTS = 10000  # Alerts kept in memory; the oldest are dropped beyond this
+MAX_SEVERITY = 5
+DEDUP_WINDOW = 1024  # Recent distinct alerts checked for duplicates
+HISTORY_FLUSH_INTERVAL = 1.0  # Seconds between appends to the alert history file
+HISTORY_MAX_BYTES = 10 * 1024 * 1024  # History file size at which it is rotated to <file>.1
+CLOCK_RESOLUTION_NS = 1_000_000  # Alerts created within 1 ms of each other share a timestamp
+MAX_TRADES = 10000  # Trade records and P&L values kept in memory; aggregates still cover every trade
+MONITORING_INTERVAL = 60  # Seconds between risk checks
+RISK_ALERT_BACKOFF = (60, 300, 900)  # Seconds between repeats of a sustained risk alert
+
+# P&L direction per position side: pnl = sign * (price - entry_price) * quantity
+_SIDE_SIGN = {PositionSide.LONG: 1.0, PositionSide.SHORT: -1.0}
+
+# Log level per alert type; other types log at INFO
+_LEVEL_BY_TYPE = {AlertType.WARNING: logging.WARNING, AlertType.ERROR: logging.ERROR}
+
+NOTIFY_QUEUE_SIZE = 1000  # Alerts waiting for delivery before new ones are dropped
+TELEGRAM_API_URL = 'https://api.telegram.org/bot{token}/sendMessage'
+TELEGRAM_TIMEOUT = 10  # Seconds per Telegram request
+TELEGRAM_MAX_MESSAGE = 4096  # Telegram's limit on message length
+TELEGRAM_MAX_ALERT_TEXT = 600  # Characters of an alert message included in a Telegram line
+TELEGRAM_MAX_RETRIES = 3  # Attempts per message when rate limited (HTTP 429)
+NOTIFY_BATCH_WINDOW = 0.5  # Seconds to collect a burst of alerts into one Telegram message
+NOTIFY_MAX_BATCH = 20  # Alerts combined into one batch at most
+
+
+class _CoarseClock:
+    """
+    datetime.now() cached for CLOCK_RESOLUTION_NS, so a burst of events reuses one datetime.
+    
+    Checking the monotonic clock is much cheaper than building a new datetime each time.
+    """
+    
+    def __init__(self):
+        """Initialize clock."""
+        self._monotonic_ns = time.monotonic_ns
+        self._expires = 0
+        self._now = datetime.now()
+    
+    def now(self) -> datetime:
+        """
+        Get the current local time at CLOCK_RESOLUTION_NS resolution.
+        
+        Returns:
+            Current time
+        """
+        tick = self._monotonic_ns()
+        if tick >= self._expires:
+            self._now = datetime.now()
+            self._expires = tick + CLOCK_RESOLUTION_NS
+        return self._now
+
+
+@lru_cache(maxsize=1024)
+def _format_timestamp(timestamp: datetime) -> str:
+    """
+    Format an alert timestamp for notifications.
+    
+    Alerts from one burst share a coarse-clock datetime, so they format it once.
+    
+    Args:
+        timestamp: Alert timestamp
+        
+    Returns:
+        Timestamp as 'YYYY-MM-DD HH:MM:SS'
+    """
+    return timestamp.strftime('%Y-%m-%d %H:%M:%S')
+
+
+@dataclass
+class _PooledSmtp:
+    """An authenticated SMTP connection and the number of messages sent on it."""
+    conn: smtplib.SMTP
+    sent_count: int = 0
+
+
+class _SmtpPool:
+    """
+    Pool of persistent, authenticated SMTP connections.
+    
+    Connecting, STARTTLS and AUTH cost several round trips, so connections are
+    kept open between alerts and recycled after a fixed number of messages.
+    """
+    
+    def __init__(self, email_config: Dict):
+        """
+        Initialize SMTP pool.
+        
+        Args:
+            email_config: Email alert configuration
+        """
+        self.email_config = email_config
+        self.max_messages = email_config.get('max_messages_per_connection', 100)
+        self._idle: queue.Queue = queue.Queue(maxsize=email_config.get('pool_size', 5))
+    
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP connection."""
+        host = self.email_config.get('smtp_server')
+        port = self.email_config.get('smtp_port')
+        
+        if self.email_config.get('use_ssl', False):
+            conn = smtplib.SMTP_SSL(host, port)
+        else:
+            conn = smtplib.SMTP(host, port)
+            conn.starttls()
+        conn.login(self.email_config.get('username'), self.email_config.get('password'))
+        return conn
+    
+    @staticmethod
+    def _close(entry: _PooledSmtp) -> None:
+        """Close a connection, ignoring errors from an already dead session."""
+        try:
+            entry.conn.quit()
+        except (smtplib.SMTPException, OSError):
+            entry.conn.close()
+    
+    def _acquire(self) -> _PooledSmtp:
+        """Take a live idle connection from the pool, or open a new one."""
+        while True:
+            try:
+                entry = self._idle.get_nowait()
+            except queue.Empty:
+                return _PooledSmtp(self._connect())
+            
+            # Servers drop idle sessions; a NOOP is much cheaper than a fresh handshake
+            try:
+                if entry.conn.noop()[0] == 250:
+                    return entry
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close(entry)
+    
+    def _release(self, entry: _PooledSmtp) -> None:
+        """Return a connection to the pool, or close it if recycled or the pool is full."""
+        if entry.sent_count >= self.max_messages:
+            self._close(entry)
+            return
+        try:
+            self._idle.put_nowait(entry)
+        except queue.Full:
+            self._close(entry)
+    
+    def send(self, msgs: List[EmailMessage]) -> None:
+        """
+        Send messages back to back over one pooled connection.
+        
+        If the session is lost part way, the connection is reopened once and the
+        failed message retried on it.
+        
+        Args:
+            msgs: Messages to send (each goes to all its recipients in a single transaction)
+        """
+        entry = self._acquire()
+        reconnected = False
+        for msg in msgs:
+            try:
+                entry.conn.send_message(msg)
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPException, OSError):
+                self._close(entry)
+                if reconnected:
+                    raise
+                reconnected = True
+                entry = _PooledSmtp(self._connect())
+                entry.conn.send_message(msg)
+            entry.sent_count += 1
+        
+        self._release(entry)
+    
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                self._close(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
 
 class AlertManager:
     """
     Alert management system for tracking and notifying about important events.
     """
     
+    # Notification templates, filled with format_map per alert
+    _EMAIL_SUBJECT = "Crypto Trading Bot Alert: {type}"
+    _EMAIL_BODY = (
+        "Alert Type: {type}\n"
+        "Source: {source}\n"
+        "Message: {message}\n"
+        "Timestamp: {timestamp}\n"
+        "Severity: {severity}\n"
+    )
+    _TELEGRAM_LINE = "<b>[{type}]</b> {source}: {message} (severity {severity})"
+    _SEVERITY_LABELS = tuple(f"{level}/{MAX_SEVERITY}" for level in range(MAX_SEVERITY + 1))
+    
     def __init__(self, config: Dict):
         """
         Initialize alert manager.
@@ -36,14 +233,60 @@ class AlertManager:
             config: Alert configuration
         """
         self.config = config
-        self.alerts = []
+        self.alerts: deque = deque(maxlen=config.get('alerts', {}).get('max_alerts', MAX_ALERTS))
+        self._by_id: Dict[str, Alert] = {}
+        self._clock = _CoarseClock()
+        
+        # Alert ids are a random per-instance prefix plus a counter: unique across restarts
+        # (and so across reloaded history) without drawing a UUID per alert
+        self._id_prefix = uuid.uuid4().hex[:12]
+        self._id_seq = count(1)
+        
+        # Recent alerts by content, so repeats fold into the unread original
+        self._recent: Dict[Tuple, Alert] = {}
+        self._recent_order: deque = deque()
+        
+        # Per-type and per-severity views of self.alerts, in the same (time) order
+        self._by_type: Dict[AlertType, deque] = {alert_type: deque() for alert_type in AlertType}
+        self._by_severity: List[deque] = [deque() for _ in range(MAX_SEVERITY + 1)]
         self.unread_count = 0
+        self._unread: Dict[str, Alert] = {}  # Unread alerts by id, in insertion (time) order
+        self._smtp_pool: Optional[_SmtpPool] = None
+        
+        # Channel switches are read once; add_alert skips notification work when all are off
+        alerts_config = config.get('alerts', {})
+        self._email_config: Dict = alerts_config.get('email', {})
+        telegram_config = alerts_config.get('telegram', {})
+        self._email_enabled = bool(self._email_config.get('enabled', False))
+        to_address = self._email_config.get('to_address')
+        self._email_from = self._email_config.get('from_address')
+        self._email_to = ', '.join(to_address) if isinstance(to_address, list) else to_address
+        self._telegram_enabled = bool(telegram_config.get('enabled', False))
+        self._telegram_url = TELEGRAM_API_URL.format(token=telegram_config.get('bot_token'))
+        self._telegram_chat_id = telegram_config.get('chat_id')
+        self._any_channel = self._email_enabled or self._telegram_enabled
+        
+        # Notifications are delivered by a background worker so add_alert never waits on the network
+        self._notify_q: Optional[asyncio.Queue] = None
+        self._notify_task: Optional[asyncio.Task] = None
+        self._tg_session: Optional[aiohttp.ClientSession] = None
+        self._sync_executor: Optional[ThreadPoolExecutor] = None
+        
+        # Optional append-only JSONL history, written in batches by a background task
+        self._history_path: Optional[str] = config.get('alerts', {}).get('history_file')
+        self._history_buffer: List[bytes] = []
+        self._history_task: Optional[asyncio.Task] = None
+        if self._history_path:
+            self.load_recent(self.alerts.maxlen or MAX_ALERTS)
     
     def add_alert(self, alert_type: AlertType, source: str, message: str, 
                  related_entity_id: Optional[str] = None, severity: int = 1) -> Alert:
         """
         Add a new alert.
         
+        An alert identical to a recent one that is still unread is not stored or
+        notified again; the original's duplicate_count is incremented instead.
+        
         Args:
             alert_type: Alert type
             source: Alert source
@@ -52,106 +295,427 @@ class AlertManager:
             severity: Alert severity (1-5)
             
         Returns:
-            Created alert
+            Created alert, or the existing alert the duplicate was folded into
         """
-        alert_id = str(uuid.uuid4())
-        alert = Alert(
-            id=alert_id,
-            type=alert_type,
-            source=source,
-            message=message,
-            timestamp=datetime.now(),
-            is_read=False,
-            related_entity_id=related_entity_id,
-            severity=severity
-        )
+        key = (alert_type, source, message, related_entity_id)
+        original = self._recent.get(key)
+        if original is not None and not original.is_read and original.id in self._by_id:
+            original.duplicate_count += 1
+            return original
         
-        self.alerts.append(alert)
-        self.unread_count += 1
+        # Positional in Alert field order: type, source, message, timestamp, is_read, related_entity_id, severity, id
+        alert = Alert(alert_type, source, message, self._clock.now(), False, related_entity_id, severity,
+                      f"{self._id_prefix}-{next(self._id_seq)}")
         
-        # Log alert
-        log_level = logging.INFO
-        if alert_type == AlertType.WARNING:
-            log_level = logging.WARNING
-        elif alert_type == AlertType.ERROR:
-            log_level = logging.ERROR
+        self._store(key, alert)
         
-        logger.log(log_level, f"Alert: [{alert_type.value}] {message}")
+        if self._history_path:
+            self._history_buffer.append(fastjson.dumps({
+                'id': alert.id,
+                'type': alert.type,
+                'source': alert.source,
+                'message': alert.message,
+                'timestamp': alert.timestamp,
+                'related_entity_id': alert.related_entity_id,
+                'severity': alert.severity
+            }))
+            if self._history_task is None or self._history_task.done():
+                self._start_history_writer()
+        
+        # Log alert
+        log_level = _LEVEL_BY_TYPE.get(alert_type, logging.INFO)
+        logger.log(log_level, "Alert: [%s] %s", alert_type.value, message)
         
         # Send notifications
-        self._send_notifications(alert)
+        if self._any_channel:
+            self._send_notifications(alert)
         
         return alert
     
+    def _store(self, key: Tuple, alert: Alert) -> None:
+        """
+        Append an alert to the history and its indexes, evicting the oldest when full.
+        
+        Args:
+            key: Alert content key
+            alert: Alert to store
+        """
+        # Drop the oldest alert from the indexes before the deque evicts it; being the
+        # oldest overall, it is also the oldest in its type and severity buckets
+        if len(self.alerts) == self.alerts.maxlen:
+            evicted = self.alerts[0]
+            del self._by_id[evicted.id]
+            self._by_type[evicted.type].popleft()
+            self._by_severity[self._severity_bucket(evicted.severity)].popleft()
+            if not evicted.is_read:
+                del self._unread[evicted.id]
+                self.unread_count -= 1
+        
+        self.alerts.append(alert)
+        self._by_id[alert.id] = alert
+        self._remember(key, alert)
+        self._by_type[alert.type].append(alert)
+        self._by_severity[self._severity_bucket(alert.severity)].append(alert)
+        if not alert.is_read:
+            self._unread[alert.id] = alert
+            self.unread_count += 1
+    
+    def load_recent(self, limit: int) -> int:
+        """
+        Reload the most recent alerts from the history file, without notifying.
+        
+        Alerts from a previous run are loaded as read.
+        
+        Args:
+            limit: Maximum number of alerts to load
+            
+        Returns:
+            Number of alerts loaded
+        """
+        try:
+            with open(self._history_path, 'rb') as f:
+                lines = deque(f, maxlen=limit)
+        except FileNotFoundError:
+            return 0
+        except OSError as e:
+            logger.error("Error reading alert history %s: %s", self._history_path, e)
+            return 0
+        
+        loaded = 0
+        for line in lines:
+            try:
+                data = fastjson.loads(line)
+                alert_type = AlertType(data['type'])
+                alert = Alert(
+                    id=data['id'],
+                    type=alert_type,
+                    source=data['source'],
+                    message=data['message'],
+                    timestamp=datetime.fromisoformat(data['timestamp']),
+                    is_read=True,
+                    related_entity_id=data.get('related_entity_id'),
+                    severity=data.get('severity', 1)
+                )
+            except (KeyError, ValueError, TypeError) as e:
+                logger.warning("Skipping malformed alert history line: %s", e)
+                continue
+            if alert.id in self._by_id:
+                continue
+            self._store((alert_type, alert.source, alert.message, alert.related_entity_id), alert)
+            loaded += 1
+        
+        return loaded
+    
+    def _flush_history(self) -> None:
+        """Append buffered alerts to the history file, rotating it when it grows too large."""
+        if not self._history_buffer:
+            return
+        lines, self._history_buffer = self._history_buffer, []
+        self._write_history(lines)
+    
+    def _write_history(self, lines: List[bytes]) -> None:
+        """
+        Append serialized alerts to the history file.
+        
+        Args:
+            lines: One JSON document per alert
+        """
+        try:
+            if os.path.exists(self._history_path) and os.path.getsize(self._history_path) >= HISTORY_MAX_BYTES:
+                os.replace(self._history_path, self._history_path + '.1')
+            with open(self._history_path, 'ab') as f:
+                f.write(b'\n'.join(lines) + b'\n')
+        except OSError as e:
+            logger.error("Error writing alert history %s: %s", self._history_path, e)
+    
+    async def _history_writer(self) -> None:
+        """Append buffered alerts to the history file once per HISTORY_FLUSH_INTERVAL until cancelled."""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                await asyncio.sleep(HISTORY_FLUSH_INTERVAL)
+                if self._history_buffer:
+                    lines, self._history_buffer = self._history_buffer, []
+                    await loop.run_in_executor(None, self._write_history, lines)
+        finally:
+            # Whatever arrived since the last batch is written synchronously on shutdown
+            self._flush_history()
+    
+    def _remember(self, key: Tuple, alert: Alert) -> None:
+        """
+        Record an alert in the duplicate window, forgetting the oldest entry when full.
+        
+        Args:
+            key: Alert content key
+            alert: Alert stored under the key
+        """
+        if len(self._recent_order) == DEDUP_WINDOW:
+            old_key, old_alert = self._recent_order.popleft()
+            # The key may have been re-recorded for a newer alert since
+            if self._recent.get(old_key) is old_alert:
+                del self._recent[old_key]
+        
+        self._recent[key] = alert
+        self._recent_order.append((key, alert))
+    
     def _send_notifications(self, alert: Alert) -> None:
         """
-        Send notifications for an alert.
+        Queue notifications for an alert.
+        
+        Inside an event loop the alert is handed to the notification worker (started
+        on demand); without a running loop it is delivered from a background thread.
         
         Args:
             alert: Alert to send notifications for
         """
-        # Email notification
-        if self.config.get('alerts', {}).get('email', {}).get('enabled', False):
-            self._send_email_notification(alert)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # One thread keeps alerts in order; the interpreter waits for it at exit
+            if self._sync_executor is None:
+                self._sync_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='alert-notify')
+            self._sync_executor.submit(asyncio.run, self._deliver([alert]))
+            return
         
-        # Telegram notification
-        if self.config.get('alerts', {}).get('telegram', {}).get('enabled', False):
-            self._send_telegram_notification(alert)
+        self.start_notification_worker()
+        try:
+            self._notify_q.put_nowait(alert)
+        except asyncio.QueueFull:
+            logger.warning("Notification queue full, dropping notifications for alert %s", alert.id)
     
-    def _send_email_notification(self, alert: Alert) -> None:
+    def _start_history_writer(self) -> None:
         """
-        Send email notification for an alert.
+        Start the background history writer on the running event loop.
         
-        Args:
-            alert: Alert to send notification for
+        Without a running loop there is nothing to run it on, so buffered alerts are
+        appended right away instead.
         """
         try:
-            email_config = self.config.get('alerts', {}).get('email', {})
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_history()
+            return
+        self._history_task = loop.create_task(self._history_writer())
+    
+    def start_notification_worker(self) -> None:
+        """Start the background notification worker (and history writer) on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._history_path and (self._history_task is None or self._history_task.done()):
+            self._start_history_writer()
+        
+        if self._notify_task is not None and not self._notify_task.done():
+            return
+        
+        self._notify_q = asyncio.Queue(maxsize=NOTIFY_QUEUE_SIZE)
+        self._notify_task = loop.create_task(self._notify_worker())
+    
+    async def stop_notification_worker(self) -> None:
+        """Stop the notification worker and release its network connections."""
+        if self._notify_task is not None:
+            self._notify_task.cancel()
+            try:
+                await self._notify_task
+            except asyncio.CancelledError:
+                pass
+            self._notify_task = None
+            self._notify_q = None
+        
+        if self._history_task is not None:
+            self._history_task.cancel()
+            try:
+                await self._history_task
+            except asyncio.CancelledError:
+                pass
+            self._history_task = None
+        
+        if self._tg_session is not None:
+            await self._tg_session.close()
+            self._tg_session = None
+        
+        if self._smtp_pool is not None:
+            self._smtp_pool.close()
+    
+    async def flush_notifications(self) -> None:
+        """Wait until every queued notification has been delivered."""
+        if self._notify_q is not None:
+            await self._notify_q.join()
+    
+    async def _notify_worker(self) -> None:
+        """Deliver queued alerts in batches until cancelled."""
+        self._tg_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=TELEGRAM_TIMEOUT))
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._notify_q.get()]
             
-            # Create message
-            msg = MIMEMultipart()
-            msg['From'] = email_config.get('from_address')
-            msg['To'] = email_config.get('to_address')
-            msg['Subject'] = f"Crypto Trading Bot Alert: {alert.type.value}"
+            # Collect the rest of a burst so it goes out as one Telegram message
+            deadline = loop.time() + NOTIFY_BATCH_WINDOW
+            while len(batch) < NOTIFY_MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._notify_q.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
             
-            # Create message body
-            body = f"""
-            Alert Type: {alert.type.value}
-            Source: {alert.source}
-            Message: {alert.message}
-            Timestamp: {alert.timestamp.strftime('%Y-%m-%d %H:%M:%S')}
-            Severity: {alert.severity}
-            """
+            try:
+                await self._deliver(batch)
+            finally:
+                for _ in batch:
+                    self._notify_q.task_done()
+    
+    async def _deliver(self, alerts: List[Alert]) -> None:
+        """
+        Send alerts over every enabled channel concurrently.
+        
+        Args:
+            alerts: Alerts to send notifications for
+        """
+        sends = []
+        
+        # Email notifications (smtplib blocks, so the batch runs in the default executor)
+        if self._email_enabled:
+            loop = asyncio.get_running_loop()
+            sends.append(loop.run_in_executor(None, self._send_email_notifications, alerts))
+        
+        # Telegram notification, one message per batch
+        if self._telegram_enabled:
+            sends.append(self._send_telegram_notification(alerts))
+        
+        await asyncio.gather(*sends)
+    
+    def _email_message(self, alert: Alert) -> EmailMessage:
+        """
+        Build the notification email for an alert.
+        
+        Args:
+            alert: Alert to build the email for
             
-            msg.attach(MIMEText(body, 'plain'))
+        Returns:
+            Email message
+        """
+        fields = {
+            'type': alert.type.value,
+            'source': alert.source,
+            'message': alert.message,
+            'timestamp': _format_timestamp(alert.timestamp),
+            'severity': self._SEVERITY_LABELS[self._severity_bucket(alert.severity)]
+        }
+        
+        msg = EmailMessage()
+        msg['From'] = self._email_from
+        msg['To'] = self._email_to
+        msg['Subject'] = self._EMAIL_SUBJECT.format_map(fields)
+        msg.set_content(self._EMAIL_BODY.format_map(fields))
+        return msg
+    
+    def _send_email_notifications(self, alerts: List[Alert]) -> None:
+        """
+        Send email notifications for a batch of alerts over a single SMTP session.
+        
+        Args:
+            alerts: Alerts to send notifications for
+        """
+        try:
+            msgs = [self._email_message(alert) for alert in alerts]
             
-            # Send email
-            server = smtplib.SMTP(email_config.get('smtp_server'), email_config.get('smtp_port'))
-            server.starttls()
-            server.login(email_config.get('username'), email_config.get('password'))
-            server.send_message(msg)
-            server.quit()
+            # Send emails over a pooled connection
+            if self._smtp_pool is None:
+                self._smtp_pool = _SmtpPool(self._email_config)
+            self._smtp_pool.send(msgs)
             
-            logger.info(f"Email notification sent for alert {alert.id}")
+            logger.info("Email notifications sent for %d alert(s)", len(msgs))
         except Exception as e:
-            logger.error(f"Error sending email notification: {e}")
+            logger.error("Error sending email notification: %s", e)
     
-    def _send_telegram_notification(self, alert: Alert) -> None:
+    async def _send_telegram_notification(self, alerts: List[Alert]) -> None:
         """
-        Send Telegram notification for an alert.
+        Send Telegram notification for a batch of alerts.
+        
+        The alerts are combined into as few messages as Telegram's length limit allows.
+        Uses the worker's keep-alive session, or a one-off session outside the worker.
         
         Args:
-            alert: Alert to send notification for
+            alerts: Alerts to send notification for
         """
         try:
-            # This is a placeholder for Telegram notification
-            # In a real implementation, you would use the python-telegram-bot library
-            # to send a message to the configured chat
-            telegram_config = self.config.get('alerts', {}).get('telegram', {})
+            url = self._telegram_url
+            chat_id = self._telegram_chat_id
             
-            logger.info(f"Telegram notification sent for alert {alert.id}")
+            session = self._tg_session
+            if session is None or session.closed:
+                async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=TELEGRAM_TIMEOUT)) as session:
+                    for text in self._telegram_messages(alerts):
+                        await self._post_telegram(session, url, chat_id, text)
+            else:
+                for text in self._telegram_messages(alerts):
+                    await self._post_telegram(session, url, chat_id, text)
+            
+            logger.info("Telegram notification sent for %d alert(s)", len(alerts))
         except Exception as e:
-            logger.error(f"Error sending Telegram notification: {e}")
+            logger.error("Error sending Telegram notification: %s", e)
+    
+    @classmethod
+    def _telegram_messages(cls, alerts: List[Alert]) -> List[str]:
+        """
+        Format alerts as HTML lines and pack them into messages within Telegram's length limit.
+        
+        Args:
+            alerts: Alerts to format
+            
+        Returns:
+            Message texts
+        """
+        messages = []
+        current = ''
+        for alert in alerts:
+            # Cut before escaping so an entity is never split; even all-'&' text stays under the limit
+            line = cls._TELEGRAM_LINE.format_map({
+                'type': alert.type.value,
+                'source': html.escape(alert.source[:TELEGRAM_MAX_ALERT_TEXT // 6], quote=False),
+                'message': html.escape(alert.message[:TELEGRAM_MAX_ALERT_TEXT], quote=False),
+                'severity': cls._SEVERITY_LABELS[cls._severity_bucket(alert.severity)]
+            })
+            if current and len(current) + 1 + len(line) > TELEGRAM_MAX_MESSAGE:
+                messages.append(current)
+                current = line
+            else:
+                current = f"{current}\n{line}" if current else line
+        if current:
+            messages.append(current)
+        return messages
+    
+    @staticmethod
+    async def _post_telegram(session: aiohttp.ClientSession, url: str, chat_id: str, text: str) -> None:
+        """
+        Post a sendMessage request to the Telegram Bot API, waiting out rate limits.
+        
+        Args:
+            session: HTTP session
+            url: sendMessage URL including the bot token
+            chat_id: Target chat
+            text: HTML message text
+            
+        Raises:
+            aiohttp.ClientResponseError: If Telegram rejects the request or keeps rate limiting it
+        """
+        payload = {'chat_id': chat_id, 'text': text, 'parse_mode': 'HTML'}
+        for attempt in range(TELEGRAM_MAX_RETRIES):
+            async with session.post(url, json=payload) as response:
+                if response.status != 429 or attempt == TELEGRAM_MAX_RETRIES - 1:
+                    response.raise_for_status()
+                    return
+                
+                # Telegram says how long to back off in parameters.retry_after
+                try:
+                    body = await response.json()
+                    retry_after = body.get('parameters', {}).get('retry_after', 1)
+                except (aiohttp.ContentTypeError, ValueError):
+                    retry_after = 1
+            
+            logger.warning("Telegram rate limit hit, retrying in %ss", retry_after)
+            await asyncio.sleep(retry_after)
     
     def mark_as_read(self, alert_id: str) -> bool:
         """
@@ -163,30 +727,54 @@ class AlertManager:
         Returns:
             Whether the alert was found and marked as read
         """
-        for alert in self.alerts:
-            if alert.id == alert_id and not alert.is_read:
-                alert.is_read = True
-                self.unread_count -= 1
-                return True
+        alert = self._by_id.get(alert_id)
+        if alert is None or alert.is_read:
+            return False
         
-        return False
+        alert.is_read = True
+        del self._unread[alert_id]
+        self.unread_count -= 1
+        return True
+    
+    @staticmethod
+    def _severity_bucket(severity: int) -> int:
+        """Clamp a severity to a valid bucket index (1-5)."""
+        return min(max(severity, 1), MAX_SEVERITY)
     
-    def get_alerts(self, limit: int = 50, include_read: bool = False) -> List[Alert]:
+    def get_alerts(self, limit: int = 50, include_read: bool = False,
+                   alert_type: Optional[AlertType] = None, min_severity: int = 1) -> List[Alert]:
         """
-        Get alerts.
+        Get alerts, newest first.
+        
+        Filters walk the narrowest per-type or per-severity bucket rather than the whole history.
         
         Args:
             limit: Maximum number of alerts to return
             include_read: Whether to include read alerts
+            alert_type: Only return alerts of this type
+            min_severity: Only return alerts with at least this severity
             
         Returns:
             List of alerts
         """
-        if include_read:
-            return sorted(self.alerts, key=lambda a: a.timestamp, reverse=True)[:limit]
+        # Alerts are appended in time order, so newest-first is a reverse walk
+        if alert_type is None and min_severity <= 1 and not include_read:
+            return list(islice(reversed(self._unread.values()), limit))
+        
+        if alert_type is not None:
+            source = reversed(self._by_type[alert_type])
+        elif min_severity > 1:
+            buckets = self._by_severity[self._severity_bucket(min_severity):]
+            source = heapq.merge(*(reversed(bucket) for bucket in buckets),
+                                 key=lambda a: a.timestamp, reverse=True)
         else:
-            return sorted([a for a in self.alerts if not a.is_read], 
-                         key=lambda a: a.timestamp, reverse=True)[:limit]
+            source = reversed(self.alerts)
+        
+        if alert_type is not None and min_severity > 1:
+            source = (a for a in source if a.severity >= min_severity)
+        if not include_read:
+            source = (a for a in source if not a.is_read)
+        return list(islice(source, limit))
     
     def get_unread_count(self) -> int:
         """
@@ -203,14 +791,36 @@ class PerformanceMonitor:
     Performance monitoring system for tracking trading performance.
     """
     
-    def __init__(self):
-        """Initialize performance monitor."""
+    def __init__(self, max_trades: int = MAX_TRADES):
+        """
+        Initialize performance monitor.
+        
+        Args:
+            max_trades: Number of most recent trades whose records and P&L are kept
+        """
         self.initial_balance = 0.0
         self.current_balance = 0.0
         self.peak_balance = 0.0
-        self.trades = []
-        self.daily_performance = {}
+        self.trades: deque = deque(maxlen=max_trades)
+        self.daily_performance: Dict[int, Dict] = {}  # Keyed by date ordinal
+        self._day_keys: Dict[int, str] = {}  # Date ordinal -> ISO date, formatted once per day
+        self._days: List[int] = []  # Date ordinals in daily_performance, sorted
         self.strategy_performance = {}
+        
+        # Running aggregates so the summary does not rescan self.trades, which only holds recent trades
+        self.total_trades = 0
+        self.winning_trades = 0
+        self.losing_trades = 0
+        self.gross_profit = 0.0
+        self.gross_loss = 0.0
+        
+        # Raw running sums and their Neumaier compensation terms, keyed by accumulator
+        self._sums: Dict[Tuple, float] = {}
+        self._comp: Dict[Tuple, float] = {}
+        
+        # P&L of the most recent max_trades trades as a fixed-size ring for vectorized distribution metrics
+        self._pnl = np.empty(max_trades, dtype=np.float64)
+        self._n = 0
     
     def set_initial_balance(self, balance: float) -> None:
         """
@@ -243,44 +853,99 @@ class PerformanceMonitor:
             trade_data: Trade data
         """
         self.trades.append(trade_data)
+        profit_loss = trade_data.get('profit_loss', 0.0)
+        trade_day = trade_data.get('timestamp').toordinal()
+        strategy_id = trade_data.get('strategy_id', 'unknown')
+        is_win = profit_loss > 0
+        is_loss = profit_loss < 0
+        
+        self._pnl[self.total_trades % len(self._pnl)] = profit_loss
+        self.total_trades += 1
+        if self._n < len(self._pnl):
+            self._n += 1
+        
+        # Update overall aggregates
+        if is_win:
+            self.winning_trades += 1
+            self.gross_profit = self._ksum(('gross_profit',), profit_loss)
+        elif is_loss:
+            self.losing_trades += 1
+            self.gross_loss = self._ksum(('gross_loss',), -profit_loss)
         
         # Update daily performance
-        trade_date = trade_data.get('timestamp').date().isoformat()
-        if trade_date not in self.daily_performance:
-            self.daily_performance[trade_date] = {
+        daily_perf = self.daily_performance.get(trade_day)
+        if daily_perf is None:
+            daily_perf = self.daily_performance[trade_day] = {
                 'profit_loss': 0.0,
                 'trades': 0,
                 'wins': 0,
                 'losses': 0
             }
-        
-        daily_perf = self.daily_performance[trade_date]
-        daily_perf['profit_loss'] += trade_data.get('profit_loss', 0.0)
-        daily_perf['trades'] += 1
-        
-        if trade_data.get('profit_loss', 0.0) > 0:
-            daily_perf['wins'] += 1
-        elif trade_data.get('profit_loss', 0.0) < 0:
-            daily_perf['losses'] += 1
+            self._day_keys[trade_day] = date.fromordinal(trade_day).isoformat()
+            if not self._days or trade_day > self._days[-1]:
+                self._days.append(trade_day)
+            else:
+                bisect.insort(self._days, trade_day)
+        self._accumulate(daily_perf, is_win, is_loss)
+        daily_perf['profit_loss'] = self._ksum(('daily', trade_day), profit_loss)
         
         # Update strategy performance
-        strategy_id = trade_data.get('strategy_id', 'unknown')
-        if strategy_id not in self.strategy_performance:
-            self.strategy_performance[strategy_id] = {
+        strategy_perf = self.strategy_performance.get(strategy_id)
+        if strategy_perf is None:
+            strategy_perf = self.strategy_performance[strategy_id] = {
                 'profit_loss': 0.0,
                 'trades': 0,
                 'wins': 0,
-                'losses': 0
+                'losses': 0,
+                'gross_profit': 0.0,
+                'gross_loss': 0.0
             }
+        self._accumulate(strategy_perf, is_win, is_loss)
+        strategy_perf['profit_loss'] = self._ksum(('strategy', strategy_id), profit_loss)
+        if is_win:
+            strategy_perf['gross_profit'] = self._ksum(('strategy_gross_profit', strategy_id), profit_loss)
+        elif is_loss:
+            strategy_perf['gross_loss'] = self._ksum(('strategy_gross_loss', strategy_id), -profit_loss)
+    
+    def _ksum(self, key: Tuple, value: float) -> float:
+        """
+        Add a value to a running sum using Neumaier compensated summation.
+        
+        Keeps long-running P&L totals from drifting as millions of small amounts are added.
+        
+        Args:
+            key: Accumulator identifier
+            value: Value to add
+            
+        Returns:
+            Compensated running total
+        """
+        total = self._sums.get(key, 0.0)
+        t = total + value
+        if abs(total) >= abs(value):
+            compensation = self._comp.get(key, 0.0) + ((total - t) + value)
+        else:
+            compensation = self._comp.get(key, 0.0) + ((value - t) + total)
+        self._sums[key] = t
+        self._comp[key] = compensation
+        return t + compensation
+    
+    @staticmethod
+    def _accumulate(perf: Dict, is_win: bool, is_loss: bool) -> None:
+        """
+        Count one trade in a performance bucket (the P&L total is kept by _ksum).
         
-        strategy_perf = self.strategy_performance[strategy_id]
-        strategy_perf['profit_loss'] += trade_data.get('profit_loss', 0.0)
-        strategy_perf['trades'] += 1
+        Args:
+            perf: Daily or strategy performance dict
+            is_win: Whether the trade made a profit
+            is_loss: Whether the trade made a loss
+        """
+        perf['trades'] += 1
         
-        if trade_data.get('profit_loss', 0.0) > 0:
-            strategy_perf['wins'] += 1
-        elif trade_data.get('profit_loss', 0.0) < 0:
-            strategy_perf['losses'] += 1
+        if is_win:
+            perf['wins'] += 1
+        elif is_loss:
+            perf['losses'] += 1
     
     def get_performance_summary(self) -> Dict:
         """
@@ -292,12 +957,18 @@ class PerformanceMonitor:
         total_profit_loss = self.current_balance - self.initial_balance
         profit_loss_percentage = (total_profit_loss / self.initial_balance) * 100 if self.initial_balance > 0 else 0
         
-        total_trades = len(self.trades)
-        winning_trades = sum(1 for trade in self.trades if trade.get('profit_loss', 0.0) > 0)
-        losing_trades = sum(1 for trade in self.trades if trade.get('profit_loss', 0.0) < 0)
+        total_trades = self.total_trades
+        winning_trades = self.winning_trades
+        losing_trades = self.losing_trades
         
         win_rate = (winning_trades / total_trades) * 100 if total_trades > 0 else 0
         
+        # Distribution metrics over the P&L of recent trades (order within the ring does not matter)
+        pnl = self._pnl[:self._n]
+        largest_win = max(float(pnl.max()), 0.0) if self._n else 0.0
+        largest_loss = max(-float(pnl.min()), 0.0) if self._n else 0.0
+        pnl_std = float(pnl.std()) if self._n > 1 else 0.0
+        
         max_drawdown = 0.0
         if self.peak_balance > 0:
             max_drawdown = ((self.peak_balance - self.current_balance) / self.peak_balance) * 100
@@ -312,6 +983,11 @@ class PerformanceMonitor:
             'winning_trades': winning_trades,
             'losing_trades': losing_trades,
             'win_rate': win_rate,
+            'gross_profit': self.gross_profit,
+            'gross_loss': self.gross_loss,
+            'largest_win': largest_win,
+            'largest_loss': largest_loss,
+            'pnl_std': pnl_std,
             'max_drawdown': max_drawdown,
             'strategy_performance': self.strategy_performance
         }
@@ -321,9 +997,26 @@ class PerformanceMonitor:
         Get daily performance.
         
         Returns:
-            Daily performance
+            Daily performance keyed by ISO date
+        """
+        day_keys = self._day_keys
+        return {day_keys[day]: perf for day, perf in self.daily_performance.items()}
+    
+    def get_daily_performance_since(self, since: date) -> Dict:
         """
-        return self.daily_performance
+        Get daily performance from a given day onwards.
+        
+        Args:
+            since: First day to include
+            
+        Returns:
+            Daily performance keyed by ISO date, oldest first
+        """
+        days = self._days
+        day_keys = self._day_keys
+        daily_performance = self.daily_performance
+        start = bisect.bisect_left(days, since.toordinal())
+        return {day_keys[day]: daily_performance[day] for day in islice(days, start, None)}
 
 
 class MonitoringSystem:
@@ -342,7 +1035,11 @@ class MonitoringSystem:
         self.config = config
         self.risk_manager = risk_manager
         self.alert_manager = AlertManager(config)
-        self.performance_monitor = PerformanceMonitor()
+        self.performance_monitor = PerformanceMonitor(config.get('max_trades', MAX_TRADES))
+        
+        # Active risk conditions: key -> (next repeat time, backoff step)
+        self._risk_state: Dict[str, Tuple[float, int]] = {}
+        self._stop: Optional[asyncio.Event] = None
         
         # Initialize with default values
         self.performance_monitor.set_initial_balance(
@@ -368,18 +1065,21 @@ class MonitoringSystem:
             alert_type, source, message, related_entity_id, severity
         )
     
-    def get_alerts(self, limit: int = 50, include_read: bool = False) -> List[Alert]:
+    def get_alerts(self, limit: int = 50, include_read: bool = False,
+                   alert_type: Optional[AlertType] = None, min_severity: int = 1) -> List[Alert]:
         """
         Get alerts.
         
         Args:
             limit: Maximum number of alerts to return
             include_read: Whether to include read alerts
+            alert_type: Only return alerts of this type
+            min_severity: Only return alerts with at least this severity
             
         Returns:
             List of alerts
         """
-        return self.alert_manager.get_alerts(limit, include_read)
+        return self.alert_manager.get_alerts(limit, include_read, alert_type, min_severity)
     
     def update_balance(self, balance: float) -> None:
         """
@@ -416,10 +1116,12 @@ class MonitoringSystem:
             order: Order to monitor
         """
         # Log order
-        logger.info(f"Order {order.id}: {order.side.value} {order.quantity} {order.trading_pair} on {order.exchange} at {order.price}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Order %s: %s %s %s on %s at %s", order.id, order.side.value, order.quantity,
+                        order.trading_pair, order.exchange, order.price)
         
         # Create alert for filled orders
-        if order.status.value == "FILLED":
+        if order.status is OrderStatus.FILLED:
             self.add_alert(
                 AlertType.SUCCESS,
                 "Order Execution",
@@ -428,7 +1130,7 @@ class MonitoringSystem:
             )
         
         # Create alert for rejected orders
-        elif order.status.value == "REJECTED":
+        elif order.status is OrderStatus.REJECTED:
             self.add_alert(
                 AlertType.ERROR,
                 "Order Execution",
@@ -446,10 +1148,7 @@ class MonitoringSystem:
             current_price: Current price
         """
         # Calculate unrealized P&L
-        if position.side.value == "LONG":
-            unrealized_pnl = (current_price - position.entry_price) * position.quantity
-        else:  # SHORT
-            unrealized_pnl = (position.entry_price - current_price) * position.quantity
+        unrealized_pnl = _SIDE_SIGN[position.side] * (current_price - position.entry_price) * position.quantity
         
         # Update position
         position.unrealized_pnl = unrealized_pnl
@@ -458,9 +1157,48 @@ class MonitoringSystem:
         entry_value = position.entry_price * position.quantity
         unrealized_pnl_percentage = (unrealized_pnl / entry_value) * 100 if entry_value > 0 else 0
         
+        self._report_position_pnl(position, unrealized_pnl_percentage)
+    
+    def monitor_positions(self, positions: List[Position], prices: np.ndarray) -> None:
+        """
+        Monitor a batch of positions, computing P&L for all of them in one vectorized pass.
+        
+        Args:
+            positions: Positions to monitor
+            prices: Current price of each position, in the same order
+        """
+        if not positions:
+            return
+        
+        entry = np.fromiter((p.entry_price for p in positions), dtype=np.float64, count=len(positions))
+        qty = np.fromiter((p.quantity for p in positions), dtype=np.float64, count=len(positions))
+        sign = np.fromiter((_SIDE_SIGN[p.side] for p in positions), dtype=np.float64, count=len(positions))
+        prices = np.asarray(prices, dtype=np.float64)
+        
+        unrealized_pnl = sign * (prices - entry) * qty
+        entry_value = entry * qty
+        pnl_pct = np.divide(unrealized_pnl * 100.0, entry_value,
+                            out=np.zeros_like(unrealized_pnl), where=entry_value > 0)
+        
+        for position, pnl in zip(positions, unrealized_pnl.tolist()):
+            position.unrealized_pnl = pnl
+        
+        # Only positions past the logging threshold need per-position work
+        for i in np.flatnonzero(np.abs(pnl_pct) >= 5).tolist():
+            self._report_position_pnl(positions[i], float(pnl_pct[i]))
+    
+    def _report_position_pnl(self, position: Position, unrealized_pnl_percentage: float) -> None:
+        """
+        Log and alert on a significant unrealized P&L move.
+        
+        Args:
+            position: Monitored position
+            unrealized_pnl_percentage: Unrealized P&L as a percentage of entry value
+        """
         # Log significant P&L changes
         if abs(unrealized_pnl_percentage) >= 5:
-            logger.info(f"Position {position.exchange}:{position.trading_pair} P&L: {unrealized_pnl_percentage:.2f}%")
+            logger.info("Position %s:%s P&L: %.2f%%", position.exchange, position.trading_pair,
+                        unrealized_pnl_percentage)
         
         # Create alert for significant losses
         if unrealized_pnl_percentage <= -10:
@@ -484,11 +1222,64 @@ class MonitoringSystem:
     async def run_monitoring_loop(self) -> None:
         """Run the monitoring loop."""
         logger.info("Starting monitoring loop")
+        self._stop = asyncio.Event()
+        self.alert_manager.start_notification_worker()
         
-        while True:
+        try:
+            await self._monitoring_loop()
+        finally:
+            await self.alert_manager.stop_notification_worker()
+    
+    def stop(self) -> None:
+        """Ask the monitoring loop to finish; it exits without waiting for the next tick."""
+        if self._stop is not None:
+            self._stop.set()
+    
+    def _should_alert(self, key: str, active: bool, now: float, resolved_message: str) -> bool:
+        """
+        Debounce a sustained risk condition.
+        
+        A condition alerts when it becomes active, then repeats at the RISK_ALERT_BACKOFF
+        intervals while it persists. When it clears, a single resolved alert is sent.
+        
+        Args:
+            key: Condition identifier
+            active: Whether the condition currently holds
+            now: Current monotonic time
+            resolved_message: Message for the alert sent when the condition clears
+            
+        Returns:
+            Whether the caller should raise its alert now
+        """
+        state = self._risk_state.get(key)
+        
+        if not active:
+            if state is not None:
+                del self._risk_state[key]
+                self.add_alert(AlertType.SUCCESS, "Risk Management", resolved_message)
+            return False
+        
+        if state is not None and now < state[0]:
+            return False
+        
+        step = 0 if state is None else min(state[1] + 1, len(RISK_ALERT_BACKOFF) - 1)
+        self._risk_state[key] = (now + RISK_ALERT_BACKOFF[step], step)
+        return True
+    
+    async def _monitoring_loop(self) -> None:
+        """Check risk conditions every MONITORING_INTERVAL seconds until stopped."""
+        # Run on a fixed cadence so check duration doesn't add drift
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        
+        while not self._stop.is_set():
             try:
+                now = time.monotonic()
+                
                 # Check for circuit breaker conditions
-                if self.risk_manager and self.risk_manager.is_circuit_breaker_triggered():
+                if self._should_alert('circuit_breaker',
+                                      bool(self.risk_manager and self.risk_manager.is_circuit_breaker_triggered()),
+                                      now, "Circuit breaker cleared"):
                     self.add_alert(
                         AlertType.ERROR,
                         "Risk Management",
@@ -501,7 +1292,8 @@ class MonitoringSystem:
                     current_drawdown = self.risk_manager.get_current_drawdown()
                     max_drawdown = self.risk_manager.max_drawdown
                     
-                    if current_drawdown >= max_drawdown * 0.8:
+                    if self._should_alert('drawdown', current_drawdown >= max_drawdown * 0.8,
+                                          now, "Drawdown back below warning level"):
                         self.add_alert(
                             AlertType.WARNING,
                             "Risk Management",
@@ -509,8 +1301,17 @@ class MonitoringSystem:
                             severity=3
                         )
                 
-                # Sleep for a while
-                await asyncio.sleep(60)
             except Exception as e:
-                logger.error(f"Error in monitoring loop: {e}")
-                await asyncio.sleep(60)
+                logger.error("Error in monitoring loop: %s", e)
+            
+            next_tick += MONITORING_INTERVAL
+            now = loop.time()
+            if next_tick < now:
+                # Checks overran the interval - drop the missed ticks rather than catching up
+                next_tick = now
+            
+            # Wait for the next tick, waking early if stop() is called
+            try:
+                await asyncio.wait_for(self._stop.wait(), next_tick - now)
+            except asyncio.TimeoutError:
+                pass